@@ -5,14 +5,10 @@ This script orchestrates the process of matching players between NBA active play
 and odds data using fuzzy string matching techniques with team context.
 """
 
-import sys
 import os
 from datetime import datetime
 from dotenv import load_dotenv
 
-# Add the project root to the Python path
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-
 from lib_dev.fuzzystringmatch import FuzzyStringMatch
 from lib_dev.smartbetting import SmartbettingLib
 
@@ -6,6 +6,9 @@ import os
 current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, current_dir)
 
+# Adicionar raiz do projeto ao path para importar lib_dev
+sys.path.append(os.path.dirname(current_dir))
+
 # Agora importar o active_players
 from de_para_nba_injury_players import main
 
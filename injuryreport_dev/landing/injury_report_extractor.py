@@ -5,13 +5,8 @@ This script fetches the most recent NBA injury report and uploads
 it to Google Cloud Storage in the landing layer of the data lake.
 """
 
-import sys
-import os
 from typing import NoReturn
 
-# Add the project root to the Python path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-
 from lib_dev.injuryreport import NBAInjuryReport
 from lib_dev.smartbetting import SmartbettingLib
 from lib_dev.utils import Bucket, Catalog, Table, Season
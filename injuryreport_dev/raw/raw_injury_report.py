@@ -5,14 +5,10 @@ This script processes PDF injury reports from Google Cloud Storage for the curre
 and uploads the extracted data to BigQuery. The transformation date is always current.
 """
 
-import sys
 import os
 from typing import NoReturn
 from datetime import datetime, date
 
-# Add the project root to the Python path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-
 from lib_dev.smartbetting import SmartbettingLib
 from lib_dev.utils import Bucket, Catalog, Table, Season
 
@@ -5,16 +5,12 @@ This script processes PDF injury reports from Google Cloud Storage for a date ra
 from October 20, 2025 until today and uploads the extracted data to BigQuery.
 """
 
-import sys
 import os
 from typing import NoReturn
-from datetime import datetime, date, timedelta
-
-# Add the project root to the Python path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from datetime import datetime, date
 
 from lib_dev.smartbetting import SmartbettingLib
-from lib_dev.utils import Bucket, Catalog, Table, Season
+from lib_dev.utils import Bucket, Catalog, Table, Season, daterange
 
 
 def generate_date_range(start_date: date, end_date: date) -> list[str]:
@@ -28,14 +24,7 @@ def generate_date_range(start_date: date, end_date: date) -> list[str]:
     Returns:
         List of date strings in YYYY-MM-DD format
     """
-    date_list = []
-    current_date = start_date
-
-    while current_date <= end_date:
-        date_list.append(current_date.strftime("%Y-%m-%d"))
-        current_date += timedelta(days=1)
-
-    return date_list
+    return [d.strftime("%Y-%m-%d") for d in daterange(start_date, end_date)]
 
 
 def main() -> NoReturn:
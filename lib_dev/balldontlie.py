@@ -15,10 +15,15 @@ from balldontlie.exceptions import (
 )
 from dotenv import load_dotenv
 import os
-from typing import List, Optional, Any, Dict, Callable, TypeVar
+import random
+from typing import List, Optional, Any, Dict, Callable, Tuple, TypeVar
 import time
-from datetime import date, timedelta
+from datetime import date
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from lib_dev.utils import TokenBucket, daterange
 
 # Load .env from current directory (Cloud Run)
 load_dotenv()
@@ -26,6 +31,66 @@ load_dotenv()
 
 T = TypeVar("T")
 
+# Failures worth retrying: server-side errors and network blips
+TRANSIENT_ERRORS = (ServerError, requests.ConnectionError, requests.Timeout)
+
+
+# Every valid (category, type) combination of the season averages endpoint
+SEASON_AVERAGES_COMBINATIONS: Tuple[Tuple[str, str], ...] = (
+    # General category
+    ("general", "base"),
+    ("general", "advanced"),
+    ("general", "usage"),
+    ("general", "scoring"),
+    ("general", "defense"),
+    ("general", "misc"),
+    # Clutch category
+    ("clutch", "advanced"),
+    ("clutch", "base"),
+    ("clutch", "misc"),
+    ("clutch", "scoring"),
+    ("clutch", "usage"),
+    # Defense category
+    ("defense", "2_pointers"),
+    ("defense", "3_pointers"),
+    ("defense", "greater_than_15ft"),
+    ("defense", "less_than_10ft"),
+    ("defense", "less_than_6ft"),
+    ("defense", "overall"),
+    # Shooting category
+    ("shooting", "5ft_range"),
+    ("shooting", "by_zone"),
+)
+
+
+def _transient_retry_delay(attempt: int) -> float:
+    """
+    Backoff delay for a transient failure: 0.5s, 1s, 2s, 4s... with ±20% jitter.
+
+    Args:
+        attempt: Retry attempt number, starting at 1
+
+    Returns:
+        Seconds to wait before the next attempt
+    """
+    return min(0.5 * 2 ** (attempt - 1), 30) * random.uniform(0.8, 1.2)
+
+
+def _retry_after_seconds(response: requests.Response) -> Optional[float]:
+    """
+    Read the Retry-After header of a rate limited response.
+
+    Args:
+        response: The HTTP response object
+
+    Returns:
+        Seconds to wait, or None if the header is missing or not in seconds
+    """
+    try:
+        return max(0.0, float(response.headers["Retry-After"]))
+    except (KeyError, TypeError, ValueError):
+        return None
+
 
 class BalldontlieLib:
     """
@@ -35,13 +100,18 @@ class BalldontlieLib:
     for retrieving NBA data such as teams, players, and games.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, rate_limiter: Optional[TokenBucket] = None) -> None:
         """
         Initialize the Balldontlie API client.
 
         Initializes the API client using the BALLDONTLIE_API_KEY
         environment variable.
 
+        Args:
+            rate_limiter: Optional shared token bucket. A token is taken before
+                every request, including retries, and accepted and rate limited
+                responses are reported to it so it can adapt its request rate
+
         Raises:
             ValueError: If the API key is not found in environment variables
         """
@@ -51,6 +121,25 @@ class BalldontlieLib:
             raise ValueError("BALLDONTLIE_API_KEY environment variable is required")
 
         self.api = BalldontlieAPI(api_key=api_key)
+        self.rate_limiter = rate_limiter
+
+        # Shared HTTP session for the direct requests, so the TCP/TLS connection
+        # is reused across pages and across dates fetched by concurrent workers.
+        # Failed connections are retried at the adapter; 429/5xx responses are
+        # left to the rate limit and transient error handling below.
+        self.session = requests.Session()
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=Retry(connect=3, read=0, status=0, backoff_factor=0.5),
+            ),
+        )
+
+        # Results of endpoints that change at most once a day, keyed by
+        # (endpoint, arguments, date) so repeated calls in a run reuse them
+        self._daily_cache: Dict[tuple, Any] = {}
 
     def _handle_api_exceptions(self, e: Exception, operation: str) -> None:
         """
@@ -87,6 +176,47 @@ class BalldontlieLib:
         else:
             print(f"Unexpected error during {operation}: {str(e)}")
 
+    def _get_daily(self, key: tuple, fetch: Callable[[], T]) -> T:
+        """
+        Return today's cached result of a call, fetching it on first use.
+
+        Failed (None) and empty results are not cached, so they are retried
+        on the next call.
+
+        Args:
+            key: Endpoint name and arguments identifying the call
+            fetch: Function performing the API call
+
+        Returns:
+            The cached or freshly fetched result
+        """
+        cache_key = (*key, date.today())
+        if cache_key in self._daily_cache:
+            print(f"Using cached {key[0]} from today")
+            return self._daily_cache[cache_key]
+
+        result = fetch()
+        if result:
+            self._daily_cache[cache_key] = result
+        return result
+
+    def _acquire(self) -> None:
+        """
+        Take a token from the shared rate limiter, if any, before a request.
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
+    def _record_outcome(self, accepted: bool) -> None:
+        """
+        Report an API call outcome to the shared rate limiter, if any.
+
+        Args:
+            accepted: False if the call was rate limited, else True
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.record(accepted)
+
     def _handle_rate_limit_with_retry(
         self,
         operation: Callable,
@@ -110,10 +240,20 @@ class BalldontlieLib:
 
         while retry_count < max_retries:
             try:
-                return operation()
-            except RateLimitError:
+                self._acquire()
+                result = operation()
+                self._record_outcome(True)
+                return result
+            except RateLimitError as e:
+                self._record_outcome(False)
                 retry_count += 1
-                delay = base_delay**retry_count + extra_delay
+                # Wait exactly as long as the API asks when it says so
+                retry_after = getattr(e, "retry_after", None)
+                delay = (
+                    retry_after
+                    if retry_after is not None
+                    else base_delay**retry_count + extra_delay
+                )
                 print(
                     f"Rate limit hit. Retrying in {delay} seconds... (Attempt {retry_count}/{max_retries})"
                 )
@@ -124,6 +264,16 @@ class BalldontlieLib:
                     raise RateLimitError(
                         "Rate limit exceeded after maximum retries", 429, {}
                     )
+            except TRANSIENT_ERRORS as e:
+                retry_count += 1
+                if retry_count >= max_retries:
+                    print(f"Max retries reached after transient error: {str(e)}")
+                    break
+                delay = _transient_retry_delay(retry_count)
+                print(
+                    f"Transient error: {str(e)}. Retrying in {delay:.1f} seconds... (Attempt {retry_count}/{max_retries})"
+                )
+                time.sleep(delay)
             except Exception as e:
                 print(f"Unexpected error: {str(e)}")
                 break
@@ -173,7 +323,9 @@ class BalldontlieLib:
                         if cursor is not None:
                             params["cursor"] = cursor
 
+                        self._acquire()
                         response = fetch_page(**params)
+                        self._record_outcome(True)
                         data = response.data
 
                         if not data:
@@ -200,9 +352,16 @@ class BalldontlieLib:
                         time.sleep(page_delay)
                         break  # Success, exit retry loop
 
-                    except RateLimitError:
+                    except RateLimitError as e:
+                        self._record_outcome(False)
                         retry_count += 1
-                        delay = base_delay**retry_count + extra_delay
+                        # Wait exactly as long as the API asks when it says so
+                        retry_after = getattr(e, "retry_after", None)
+                        delay = (
+                            retry_after
+                            if retry_after is not None
+                            else base_delay**retry_count + extra_delay
+                        )
                         print(
                             f"Rate limit hit. Retrying in {delay} seconds... (Attempt {retry_count}/{max_retries})"
                         )
@@ -214,6 +373,18 @@ class BalldontlieLib:
                                 "Rate limit exceeded after maximum retries", 429, {}
                             )
 
+                    except TRANSIENT_ERRORS as e:
+                        retry_count += 1
+                        if retry_count >= max_retries:
+                            # Fail the whole fetch (None) instead of returning
+                            # a silently truncated result
+                            raise
+                        delay = _transient_retry_delay(retry_count)
+                        print(
+                            f"Transient error: {str(e)}. Retrying in {delay:.1f} seconds... (Attempt {retry_count}/{max_retries})"
+                        )
+                        time.sleep(delay)
+
                     except Exception as e:
                         print(f"Unexpected error during pagination: {str(e)}")
                         # Add more detailed error information for debugging
@@ -286,9 +457,11 @@ class BalldontlieLib:
                 "Resource not found", 404, response.json() if response.content else {}
             )
         elif response.status_code == 429:
-            raise RateLimitError(
+            error = RateLimitError(
                 "Rate limit exceeded", 429, response.json() if response.content else {}
             )
+            error.retry_after = _retry_after_seconds(response)
+            raise error
         elif response.status_code >= 500:
             raise ServerError(
                 "API server error",
@@ -309,13 +482,18 @@ class BalldontlieLib:
         Retrieve all NBA teams from the API.
 
         Fetches the complete list of NBA teams from the Balldontlie API.
+        The result is cached for the rest of the day on this client.
 
         Returns:
             List of team objects if successful, None if an error occurs
         """
         try:
-            print("Getting teams...")
-            return self.api.nba.teams.list().data
+
+            def fetch_teams():
+                print("Getting teams...")
+                return self.api.nba.teams.list().data
+
+            return self._get_daily(("teams",), fetch_teams)
         except Exception as e:
             self._handle_api_exceptions(e, "teams retrieval")
             return None
@@ -431,7 +609,7 @@ class BalldontlieLib:
                 if "cursor" in params and params["cursor"] is not None:
                     request_params["cursor"] = params["cursor"]
 
-                response = requests.get(
+                response = self.session.get(
                     base_url, headers=headers, params=request_params, timeout=30
                 )
                 response_data = self._handle_http_response(response, "season averages")
@@ -467,6 +645,7 @@ class BalldontlieLib:
 
         Fetches all NBA team standings for the specified season from the Balldontlie API.
         Implements retry logic with exponential backoff for rate limit handling.
+        The result is cached for the rest of the day on this client.
 
         Args:
             season: Season year (e.g., 2024)
@@ -481,8 +660,14 @@ class BalldontlieLib:
                 response = self.api.nba.standings.get(season=season)
                 return response.data
 
-            result = self._handle_rate_limit_with_retry(
-                operation=fetch_standings, max_retries=5, base_delay=5, extra_delay=15
+            result = self._get_daily(
+                ("team standings", season),
+                lambda: self._handle_rate_limit_with_retry(
+                    operation=fetch_standings,
+                    max_retries=5,
+                    base_delay=5,
+                    extra_delay=15,
+                ),
             )
 
             if result is not None:
@@ -510,9 +695,17 @@ class BalldontlieLib:
             Dict containing data and error/status metadata
         """
         try:
+            cache_key = ("team standings", season, date.today())
+            if cache_key in self._daily_cache:
+                print(f"Using cached team standings for season {season} from today")
+                data = self._daily_cache[cache_key]
+                return {"data": data, "status": 200, "error": None, "details": None}
+
             print(f"Getting team standings for season (detailed): {season}...")
             response = self.api.nba.standings.get(season=season)
             data = response.data if response and hasattr(response, "data") else None
+            if data:
+                self._daily_cache[cache_key] = data
             return {"data": data, "status": 200, "error": None, "details": None}
         except (
             AuthenticationError,
@@ -645,18 +838,45 @@ class BalldontlieLib:
 
             all_games = []
             cursor = None
+            rate_limit_retries = 0
+            server_error_retries = 0
 
             while True:
                 if cursor:
                     params["cursor"] = cursor
 
-                response = requests.get(
+                self._acquire()
+                response = self.session.get(
                     "https://api.balldontlie.io/v1/games",
                     headers=headers,
                     params=params,
                     timeout=30,
                 )
 
+                self._record_outcome(response.status_code != 429)
+
+                if response.status_code == 429 and rate_limit_retries < 5:
+                    # Retry the same page after the wait the API asks for
+                    rate_limit_retries += 1
+                    delay = _retry_after_seconds(response)
+                    if delay is None:
+                        delay = 2**rate_limit_retries
+                    print(
+                        f"Rate limit hit. Retrying in {delay} seconds... (Attempt {rate_limit_retries}/5)"
+                    )
+                    time.sleep(delay)
+                    continue
+
+                if response.status_code >= 500 and server_error_retries < 5:
+                    # Transient server error: back off briefly and retry the page
+                    server_error_retries += 1
+                    delay = _transient_retry_delay(server_error_retries)
+                    print(
+                        f"Server error {response.status_code}. Retrying in {delay:.1f} seconds... (Attempt {server_error_retries}/5)"
+                    )
+                    time.sleep(delay)
+                    continue
+
                 if response.status_code != 200:
                     print(f"Error fetching games: {response.status_code}")
                     break
@@ -768,9 +988,8 @@ class BalldontlieLib:
             )
 
             all_games = []
-            current_date = start_date
 
-            while current_date <= end_date:
+            for current_date in daterange(start_date, end_date):
                 print(f"Processing games for date: {current_date}")
 
                 games = self.get_games_with_datetime(current_date)
@@ -780,9 +999,6 @@ class BalldontlieLib:
                         f"Added {len(games)} games for {current_date}. Total: {len(all_games)}"
                     )
 
-                # Move to next date
-                current_date += timedelta(days=1)
-
                 # Rate limiting between dates
                 time.sleep(1)
 
@@ -998,41 +1214,6 @@ class SeasonAveragesProcessor:
         self.balldontlie = balldontlie_client
         self.smartbetting = smartbetting_client
 
-    def get_all_combinations(self) -> List[tuple]:
-        """
-        Get all valid category/type combinations for season averages.
-
-        Returns:
-            List of tuples containing (category, type) combinations
-        """
-        combinations = [
-            # General category
-            ("general", "base"),
-            ("general", "advanced"),
-            ("general", "usage"),
-            ("general", "scoring"),
-            ("general", "defense"),
-            ("general", "misc"),
-            # Clutch category
-            ("clutch", "advanced"),
-            ("clutch", "base"),
-            ("clutch", "misc"),
-            ("clutch", "scoring"),
-            ("clutch", "usage"),
-            # Defense category
-            ("defense", "2_pointers"),
-            ("defense", "3_pointers"),
-            ("defense", "greater_than_15ft"),
-            ("defense", "less_than_10ft"),
-            ("defense", "less_than_6ft"),
-            ("defense", "overall"),
-            # Shooting category
-            ("shooting", "5ft_range"),
-            ("shooting", "by_zone"),
-        ]
-
-        return combinations
-
     def get_season_types_for_category(self, category: str) -> List[str]:
         """
         Get the appropriate season types for a specific category.
@@ -1089,11 +1270,8 @@ class SeasonAveragesProcessor:
                 )
                 return False
 
-            # Convert API response to dictionary format (if needed)
-            if response and hasattr(response[0], "model_dump"):
-                data = self.smartbetting.convert_object_to_dict(response)
-            else:
-                data = response  # Already in dictionary format
+            # Convert API response to dictionary format (dicts pass through)
+            data = self.smartbetting.convert_object_to_dict(response)
 
             # Convert data to NDJSON format for BigQuery compatibility
             ndjson_data = self.smartbetting.convert_to_ndjson(data)
@@ -1105,7 +1283,12 @@ class SeasonAveragesProcessor:
             gcs_blob_name = f"{storage_path}/season_averages_{category}_{type_param}_{season_type}_{season}.json"
 
             # Upload NDJSON data to Google Cloud Storage
-            self.smartbetting.upload_json_to_gcs(ndjson_data, bucket, gcs_blob_name)
+            self.smartbetting.upload_json_to_gcs(
+                ndjson_data,
+                bucket,
+                gcs_blob_name,
+                skip_if_unchanged=True,
+            )
 
             print(
                 f"✅ Successfully uploaded {len(data)} records for {category}/{type_param}/{season_type}/{season}"
@@ -11,6 +11,8 @@ from datetime import datetime, date, timedelta
 from pathlib import Path
 from dotenv import load_dotenv
 
+from lib_dev.utils import daterange
+
 # Load .env from project root
 project_root = Path(__file__).parent.parent
 load_dotenv(project_root / ".env")
@@ -350,9 +352,8 @@ class NBAInjuryReport:
             print(f"Times to try for each date: {times}")
 
             successful_fetches = []
-            current_date = start_date
 
-            while current_date <= end_date:
+            for current_date in daterange(start_date, end_date):
                 print(f"\nProcessing date: {current_date}")
 
                 for hour, period in times:
@@ -372,8 +373,6 @@ class NBAInjuryReport:
                         )
                         continue
 
-                current_date += timedelta(days=1)
-
             print(
                 f"\nHistorical fetch complete. Successfully fetched {len(successful_fetches)} reports:"
             )
@@ -0,0 +1,166 @@
+"""
+Daily extraction pipeline runner.
+
+This module provides the shared runner for the landing scripts that fetch
+one API response per date and upload it to Google Cloud Storage.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from lib_dev.smartbetting import SmartbettingLib
+from lib_dev.utils import Bucket, Catalog, Table, Season, FINAL_AFTER_DAYS, daterange
+
+
+@dataclass(frozen=True)
+class PipelineConfig:
+    """
+    Settings of a daily extraction pipeline.
+
+    Attributes:
+        bucket: GCS bucket the daily files are uploaded to
+        catalog: Data catalog of the pipeline
+        table: Data table of the pipeline
+        season: Season the extracted dates belong to
+        start_date: First date to extract (inclusive)
+        end_date: Last date to extract (inclusive)
+        label: Name of the extracted entity used in log messages
+        blob_template: GCS blob name template, formatted with catalog, table,
+            season and date (ISO format)
+        max_workers: Number of dates processed concurrently
+        skip_existing: If True, dates whose file was already uploaded once
+            their data was final are skipped without calling the API
+    """
+
+    bucket: Bucket
+    catalog: Catalog
+    table: Table
+    season: Season
+    start_date: date
+    end_date: date
+    label: str
+    blob_template: str = "{catalog}/{table}/{season}/raw_{catalog}_{table}_{date}.json"
+    max_workers: int = 4
+    skip_existing: bool = False
+
+    def blob_name(self, current_date: date) -> str:
+        """
+        Build the GCS blob name of a date.
+
+        Args:
+            current_date: Date of the daily file
+
+        Returns:
+            GCS blob name/path of the daily file
+        """
+        return self.blob_template.format(
+            catalog=self.catalog,
+            table=self.table,
+            season=self.season,
+            date=current_date.isoformat(),
+        )
+
+
+def pending_dates(cfg: PipelineConfig, smartbetting: SmartbettingLib) -> List[date]:
+    """
+    List the dates of the configured range that still need to be fetched.
+
+    With skip_existing, dates whose file was uploaded at least
+    FINAL_AFTER_DAYS after the date are left out: the same threshold
+    DateCache uses, so such a file was never built from rows cached before
+    they were final.
+
+    Args:
+        cfg: Pipeline settings
+        smartbetting: Smartbetting library used to list the uploaded files
+
+    Returns:
+        Dates to fetch in ascending order
+    """
+    dates = daterange(cfg.start_date, cfg.end_date)
+    if not cfg.skip_existing:
+        return dates
+
+    # One listing of the range's folder tells which dates are already done
+    dates_by_blob_name = {cfg.blob_name(d): d for d in dates}
+    # The common prefix may stop partway through a date (e.g. "..._2025-0").
+    # That only widens the listing; blobs outside the range are ignored below.
+    prefix = os.path.commonprefix(list(dates_by_blob_name))
+    update_times = smartbetting.list_blob_update_times(cfg.bucket, prefix)
+
+    final_dates = set()
+    for blob_name, updated in update_times.items():
+        blob_date = dates_by_blob_name.get(blob_name)
+        if blob_date and updated.date() >= blob_date + timedelta(days=FINAL_AFTER_DAYS):
+            final_dates.add(blob_date)
+    print(f"Skipping {len(final_dates)} dates already uploaded")
+
+    return [d for d in dates if d not in final_dates]
+
+
+def run_daily_pipeline(
+    cfg: PipelineConfig,
+    fetch_date: Callable[[date], Optional[List[Dict[str, Any]]]],
+    smartbetting: SmartbettingLib,
+    dates: Optional[List[date]] = None,
+) -> int:
+    """
+    Fetch, convert and upload the data of every pending date in the configured range.
+
+    Dates are processed concurrently by a thread pool. fetch_date is
+    responsible for rate limiting and caching its API calls.
+
+    Args:
+        cfg: Pipeline settings
+        fetch_date: Function returning the rows of a date as dictionaries,
+            or None if no data was received
+        smartbetting: Smartbetting library used to convert and upload the data
+        dates: Dates to process, as returned by pending_dates. Computed from
+            cfg when not given
+
+    Returns:
+        Total number of rows uploaded
+    """
+    if dates is None:
+        dates = pending_dates(cfg, smartbetting)
+
+    def process_date(current_date: date) -> int:
+        print(f"\nProcessing {cfg.label} for date: {current_date}")
+
+        data = fetch_date(current_date)
+
+        if data is None:
+            print(f"No {cfg.label} data received for {current_date}")
+            return 0
+
+        if len(data) == 0:
+            print(f"No {cfg.label} found for {current_date}")
+            return 0
+
+        # Convert data to NDJSON format for BigQuery compatibility
+        ndjson_data = smartbetting.convert_to_ndjson(data)
+
+        # Upload NDJSON data to Google Cloud Storage (by date)
+        smartbetting.upload_json_to_gcs(
+            ndjson_data,
+            cfg.bucket,
+            cfg.blob_name(current_date),
+            skip_if_unchanged=True,
+        )
+
+        print(
+            f"✅ Successfully processed and uploaded {len(data)} {cfg.label} for {current_date}"
+        )
+        return len(data)
+
+    total = 0
+
+    with ThreadPoolExecutor(max_workers=cfg.max_workers) as executor:
+        futures = [executor.submit(process_date, d) for d in dates]
+        for future in as_completed(futures):
+            total += future.result()
+
+    return total
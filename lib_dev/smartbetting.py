@@ -5,14 +5,90 @@ This module provides utilities for data conversion and GCS operations
 for the Smartbetting project.
 """
 
+from google.auth.transport.requests import AuthorizedSession
 from google.cloud import storage
 from google.cloud import bigquery
-import json
+import google.auth
+import base64
+import google_crc32c
+import gzip
+import numpy as np
+import orjson
 import pandas as pd
+import pyarrow as pa
 import re
-from typing import Any, List, Union, Optional, Dict
+import threading
+from functools import lru_cache, partial
+from io import BytesIO
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, List, Union, Optional, Dict, Tuple
 from datetime import datetime, date
 
+from lib_dev.utils import daterange
+
+# Matches the trailing date of files named like raw_odds_events_YYYY-MM-DD.json
+FILE_DATE_PATTERN = re.compile(r"_(\d{4}-\d{2}-\d{2})\.json$")
+
+# Date ranges up to this many days are filtered by GCS with a match_glob that
+# lists every date; longer ranges are listed whole and filtered locally
+MAX_GLOB_DATES = 100
+
+# Captures the report date of files named like injury_report_YYYY-MM-DD_06PM.pdf
+INJURY_REPORT_DATE_PATTERN = r"injury_report_(\d{4}-\d{2}-\d{2})_06PM\.pdf"
+
+# Maximum number of calls GCS accepts in a single JSON batch request
+GCS_BATCH_SIZE = 100
+
+# Maximum number of source objects in a single GCS compose request
+GCS_COMPOSE_MAX_SOURCES = 32
+
+# Connections kept open to GCS, enough for the thread pools that upload concurrently
+GCS_HTTP_POOL_SIZE = 16
+
+# Payloads smaller than this are uploaded uncompressed even when compression is on
+GZIP_MIN_BYTES = 4096
+
+# Payloads above this size use resumable uploads sent in chunks of this size
+GCS_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Fastest gzip level: about 3x faster than the default 6 and nearly as small for NDJSON
+GZIP_COMPRESS_LEVEL = 1
+
+
+@lru_cache(maxsize=None)
+def _model_list_adapter(model_type: type) -> Any:
+    """
+    Return a cached pydantic TypeAdapter for a list of the given model type.
+
+    pydantic is imported lazily since it is only available where the
+    API SDKs that return models are installed.
+    """
+    from pydantic import TypeAdapter
+
+    return TypeAdapter(List[model_type])
+
+
+@lru_cache(maxsize=None)
+def _get_storage_client() -> storage.Client:
+    """
+    Return the process-wide GCS client, creating it on first use.
+
+    Sharing one client across SmartbettingLib instances reuses its OAuth token
+    and its pooled HTTPS connections instead of opening new ones per instance.
+    The pooled session is passed through the constructor's _http argument
+    rather than mounted on the client's internal session afterwards.
+    """
+    credentials, _ = google.auth.default(scopes=storage.Client.SCOPE)
+    session = AuthorizedSession(credentials)
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=GCS_HTTP_POOL_SIZE, pool_maxsize=GCS_HTTP_POOL_SIZE
+        ),
+    )
+    return storage.Client(credentials=credentials, _http=session)
+
 
 class SmartbettingLib:
     """
@@ -22,6 +98,38 @@ class SmartbettingLib:
     uploading data to Google Cloud Storage.
     """
 
+    def __init__(self, verbose: bool = False) -> None:
+        """
+        Initialize the Smartbetting library.
+
+        Args:
+            verbose: If True, print extra per-file diagnostics. Defaults to False
+        """
+        self.verbose = verbose
+
+        # Bucket handles are created on first use and reused
+        self._buckets: Dict[str, storage.Bucket] = {}
+        self._storage_lock = threading.Lock()
+
+    def _get_bucket(self, bucket_name: Union[str, Any]) -> storage.Bucket:
+        """
+        Return a cached Bucket handle bound to the shared storage client.
+
+        Args:
+            bucket_name: Name of the GCS bucket (can be enum or string)
+
+        Returns:
+            Bucket handle bound to the shared storage client
+        """
+        bucket_name = bucket_name if isinstance(bucket_name, str) else str(bucket_name)
+        bucket = self._buckets.get(bucket_name)
+        if bucket is None:
+            with self._storage_lock:
+                bucket = self._buckets.setdefault(
+                    bucket_name, _get_storage_client().bucket(bucket_name)
+                )
+        return bucket
+
     def convert_to_json(self, data: Union[List[dict], dict]) -> str:
         """
         Convert data to JSON format.
@@ -37,7 +145,9 @@ class SmartbettingLib:
             TypeError: If the data cannot be serialized to JSON
         """
         print("Converting to JSON...")
-        return json.dumps(data, indent=2)
+        return orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
 
     def _normalize_numeric_types(self, obj: Any) -> Any:
         """
@@ -135,7 +245,7 @@ class SmartbettingLib:
 
     def convert_to_ndjson(
         self, data: Union[List[dict], dict], normalize_numbers: bool = True, sanitize_columns: bool = True
-    ) -> str:
+    ) -> bytes:
         """
         Convert data to NEWLINE DELIMITED JSON format for BigQuery external tables.
 
@@ -148,7 +258,8 @@ class SmartbettingLib:
                             (removes invalid characters, ensures proper format)
 
         Returns:
-            NDJSON string representation of the data (one JSON object per line)
+            UTF-8 encoded NDJSON bytes (one JSON object per line), ready to
+            be passed to upload_json_to_gcs
 
         Raises:
             TypeError: If the data cannot be serialized to JSON
@@ -165,9 +276,15 @@ class SmartbettingLib:
             data = self._normalize_numeric_types(data)
 
         if isinstance(data, list):
-            return "\n".join(json.dumps(item) for item in data)
+            # map() drives the C serializer directly; each line carries its own
+            # trailing newline, so files can also be concatenated safely
+            dump_line = partial(
+                orjson.dumps,
+                option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS,
+            )
+            return b"".join(map(dump_line, data))
         else:
-            return json.dumps(data)
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
 
     def convert_object_to_dict(self, objects: List[Any]) -> List[dict]:
         """
@@ -183,6 +300,14 @@ class SmartbettingLib:
             AttributeError: If objects don't have model_dump() method and aren't dicts
         """
         print("Converting object to dict...")
+
+        # Fast path: a homogeneous list of Pydantic models is serialized in a
+        # single call into pydantic-core instead of one model_dump() per object
+        if objects and hasattr(objects[0], "model_dump"):
+            model_type = type(objects[0])
+            if all(type(data) is model_type for data in objects):
+                return _model_list_adapter(model_type).dump_python(objects)
+
         result = []
         for data in objects:
             if isinstance(data, dict):
@@ -195,15 +320,30 @@ class SmartbettingLib:
         return result
 
     def upload_json_to_gcs(
-        self, json_data: str, bucket_name: Union[str, Any], blob_name: Union[str, Any]
+        self,
+        json_data: Union[str, bytes],
+        bucket_name: Union[str, Any],
+        blob_name: Union[str, Any],
+        skip_if_unchanged: bool = False,
+        compress: bool = False,
     ) -> None:
         """
         Upload JSON data to Google Cloud Storage bucket.
 
         Args:
-            json_data: JSON string to upload
+            json_data: JSON string or UTF-8 encoded bytes to upload
             bucket_name: Name of the GCS bucket (can be enum or string)
             blob_name: GCS blob name/path (can be enum or string)
+            skip_if_unchanged: If True, compares the payload CRC32C with the
+                checksum GCS stores for the existing blob and skips the upload
+                when they match
+            compress: If True, payloads of at least GZIP_MIN_BYTES are stored
+                gzip-compressed with Content-Encoding: gzip. The blob name is
+                kept; GCS decompresses on download for clients that don't
+                accept gzip, and BigQuery reads gzip NDJSON (without parallel
+                reads of a single file). Smaller payloads stay plain, so only
+                enable it for prefixes whose readers were checked against
+                gzip-encoded objects
 
         Returns:
             None
@@ -213,13 +353,87 @@ class SmartbettingLib:
             google.cloud.exceptions.NotFound: If the bucket doesn't exist
         """
         print("Uploading JSON to Google Cloud Storage...")
-        storage_client = storage.Client()
-        bucket = storage_client.bucket(str(bucket_name))
-        blob = bucket.blob(str(blob_name))
-
-        blob.upload_from_string(json_data, content_type="application/json")
+        blob_name = blob_name if isinstance(blob_name, str) else str(blob_name)
+
+        bucket = self._get_bucket(bucket_name)
+        blob = bucket.blob(blob_name)
+
+        payload = json_data.encode() if isinstance(json_data, str) else json_data
+        generation_match = None
+
+        if compress and len(payload) >= GZIP_MIN_BYTES:
+            # mtime=0 keeps the output stable, so skip_if_unchanged still matches
+            payload = gzip.compress(payload, compresslevel=GZIP_COMPRESS_LEVEL, mtime=0)
+            blob.content_encoding = "gzip"
+
+        if skip_if_unchanged:
+            existing = bucket.get_blob(blob_name)
+            if existing is not None:
+                # GCS exposes CRC32C as base64 of the big-endian 4-byte value
+                crc32c = base64.b64encode(
+                    google_crc32c.value(payload).to_bytes(4, "big")
+                ).decode()
+                if existing.crc32c == crc32c:
+                    print(f"⏭️  {blob_name} unchanged, skipping upload")
+                    return
+                # Only overwrite the version that was just compared
+                generation_match = existing.generation
+
+        if len(payload) > GCS_UPLOAD_CHUNK_SIZE:
+            # Resumable upload, so a failure only resends the current chunk
+            blob.chunk_size = GCS_UPLOAD_CHUNK_SIZE
+        else:
+            blob.chunk_size = None  # Single request upload, no resumable chunks
+        blob.upload_from_file(
+            BytesIO(payload),
+            size=len(payload),
+            content_type="application/json",
+            if_generation_match=generation_match,
+        )
         print("JSON uploaded to Google Cloud Storage!!!")
 
+    def compose_gcs_blobs(
+        self,
+        bucket_name: Union[str, Any],
+        source_blob_names: List[str],
+        destination_blob_name: str,
+        content_type: str = "application/json",
+    ) -> None:
+        """
+        Concatenate GCS blobs server-side into a destination blob.
+
+        No data passes through the client. GCS composes at most 32 sources per
+        request, so longer lists are folded in steps that append up to 31 more
+        sources to the destination each time. Sources must end with a newline
+        for the result to be valid NDJSON.
+
+        Args:
+            bucket_name: Name of the GCS bucket (can be enum or string)
+            source_blob_names: Blob names to concatenate, in order
+            destination_blob_name: Blob name of the composed object
+
+        Returns:
+            None
+
+        Raises:
+            google.cloud.exceptions.GoogleCloudError: If there's an issue with GCS
+        """
+        print(f"Composing {len(source_blob_names)} blobs into {destination_blob_name}...")
+        bucket = self._get_bucket(bucket_name)
+        destination = bucket.blob(destination_blob_name)
+        destination.content_type = content_type
+
+        first_step = source_blob_names[:GCS_COMPOSE_MAX_SOURCES]
+        destination.compose([bucket.blob(name) for name in first_step])
+
+        remaining = source_blob_names[GCS_COMPOSE_MAX_SOURCES:]
+        step_size = GCS_COMPOSE_MAX_SOURCES - 1
+        for start in range(0, len(remaining), step_size):
+            step = remaining[start : start + step_size]
+            destination.compose([destination] + [bucket.blob(name) for name in step])
+
+        print("Blobs composed in Google Cloud Storage!!!")
+
     def delete_gcs_folder_contents(
         self, bucket_name: Union[str, Any], prefix: str
     ) -> int:
@@ -242,21 +456,25 @@ class SmartbettingLib:
             google.cloud.exceptions.NotFound: If the bucket doesn't exist
         """
         print(f"Deleting contents of GCS folder: {prefix}")
-        storage_client = storage.Client()
-        bucket = storage_client.bucket(str(bucket_name))
+        bucket = self._get_bucket(bucket_name)
 
-        # List all blobs with the prefix
-        blobs = list(bucket.list_blobs(prefix=prefix))
+        # List all blobs with the prefix (names are all the delete needs)
+        blobs = list(
+            bucket.list_blobs(prefix=prefix, fields="items(name),nextPageToken")
+        )
 
         if not blobs:
             print("No files found to delete")
             return 0
 
-        # Delete all blobs
+        # Delete blobs through the JSON batch API (up to 100 calls per request)
         deleted_count = 0
-        for blob in blobs:
-            blob.delete()
-            deleted_count += 1
+        for start in range(0, len(blobs), GCS_BATCH_SIZE):
+            batch_blobs = blobs[start : start + GCS_BATCH_SIZE]
+            with bucket.client.batch():
+                for blob in batch_blobs:
+                    blob.delete()
+            deleted_count += len(batch_blobs)
 
         print(f"Successfully deleted {deleted_count} file(s)")
         return deleted_count
@@ -281,8 +499,7 @@ class SmartbettingLib:
         """
         try:
             print("Uploading PDF to Google Cloud Storage...")
-            storage_client = storage.Client()
-            bucket = storage_client.bucket(str(bucket_name))
+            bucket = self._get_bucket(bucket_name)
             blob = bucket.blob(str(blob_name))
 
             blob.upload_from_string(pdf_data, content_type="application/pdf")
@@ -336,6 +553,10 @@ class SmartbettingLib:
         else:
             raise TypeError(f"Unsupported data type: {type(data)}")
 
+        # BigQuery STRING columns are loaded from plain strings, not categoricals
+        for column in df.select_dtypes(include="category").columns:
+            df[column] = df[column].astype(str)
+
         # Add metadata columns
         df["extraction_timestamp"] = datetime.now().isoformat()
         if source_file:
@@ -348,8 +569,9 @@ class SmartbettingLib:
         if write_disposition == "WRITE_APPEND" and "source_file" in df.columns:
             self._delete_old_data_by_date(client, project_id, dataset_id, table_id, df)
 
-        # Configure job with explicit schema
+        # Configure a batch load job (Parquet, no streaming inserts) with explicit schema
         job_config = bigquery.LoadJobConfig(
+            source_format=bigquery.SourceFormat.PARQUET,
             write_disposition=write_disposition,
             create_disposition="CREATE_IF_NEEDED",
             schema=[
@@ -385,35 +607,34 @@ class SmartbettingLib:
             df: DataFrame com os novos dados
         """
         try:
-            # Extrair datas únicas dos arquivos processados
-            unique_dates = set()
-            for source_file in df["source_file"].unique():
-                # Extrair data do nome do arquivo (formato: injury_report_YYYY-MM-DD_06PM.pdf)
-                if "injury_report_" in source_file and "_06PM.pdf" in source_file:
-                    try:
-                        date_part = source_file.split("injury_report_")[1].split(
-                            "_06PM.pdf"
-                        )[0]
-                        unique_dates.add(date_part)
-                    except:
-                        continue
-
-            # Deletar dados antigos das mesmas datas
+            # Extrair datas únicas dos arquivos processados (vetorizado)
+            unique_dates = (
+                df["source_file"]
+                .str.extract(INJURY_REPORT_DATE_PATTERN, expand=False)
+                .dropna()
+                .unique()
+                .tolist()
+            )
+
+            # Deletar dados antigos das mesmas datas em uma única query
             if unique_dates:
-                print(f"🗑️ Deletando dados antigos das datas: {list(unique_dates)}")
-                for date in unique_dates:
-                    delete_query = f"""
-                    DELETE FROM `{project_id}.{dataset_id}.{table_id}`
-                    WHERE source_file LIKE '%injury_report_{date}_06PM.pdf%'
-                    """
-                    try:
-                        query_job = client.query(delete_query)
-                        query_job.result()  # Aguardar conclusão
-                        print(f"✅ Dados antigos da data {date} deletados")
-                    except Exception as e:
-                        print(
-                            f"⚠️ Aviso: Erro ao deletar dados antigos da data {date}: {e}"
-                        )
+                print(f"🗑️ Deletando dados antigos das datas: {unique_dates}")
+                delete_query = f"""
+                DELETE FROM `{project_id}.{dataset_id}.{table_id}`
+                WHERE REGEXP_EXTRACT(source_file, r'{INJURY_REPORT_DATE_PATTERN}')
+                    IN UNNEST(@dates)
+                """
+                job_config = bigquery.QueryJobConfig(
+                    query_parameters=[
+                        bigquery.ArrayQueryParameter("dates", "STRING", unique_dates)
+                    ]
+                )
+                try:
+                    query_job = client.query(delete_query, job_config=job_config)
+                    query_job.result()  # Aguardar conclusão
+                    print(f"✅ Dados antigos de {len(unique_dates)} data(s) deletados")
+                except Exception as e:
+                    print(f"⚠️ Aviso: Erro ao deletar dados antigos: {e}")
         except Exception as e:
             print(f"⚠️ Aviso: Erro na limpeza de dados antigos: {e}")
 
@@ -448,8 +669,7 @@ class SmartbettingLib:
         # Build path: catalog/schema/table/file_name
         blob_path = f"{catalog}/{schema}/{table}/{file_name}"
 
-        storage_client = storage.Client()
-        bucket = storage_client.bucket(bucket_name)
+        bucket = self._get_bucket(bucket_name)
         blob = bucket.blob(blob_path)
 
         blob.upload_from_string(data, content_type="application/json")
@@ -511,8 +731,70 @@ class SmartbettingLib:
     # EVENT DATA EXTRACTION METHODS
     # ========================================================================================
 
+    def _list_blob_names(
+        self,
+        bucket_name: str,
+        prefix: str,
+        suffix: str,
+        dates: Optional[List[date]] = None,
+    ) -> List[str]:
+        """
+        List the names of the blobs under a prefix that end with a suffix.
+
+        Only the blob names are requested from GCS (partial response), and
+        the suffix is matched server side, so listing pages are much smaller
+        than with full blob metadata.
+
+        Args:
+            bucket_name: GCS bucket name
+            prefix: Folder prefix to list (e.g., 'odds/events/season_2024/')
+            suffix: File extension to keep (e.g., '.json')
+            dates: Optional dates; if given, only blobs named like
+                *_YYYY-MM-DD<suffix> for one of these dates are listed
+
+        Returns:
+            List of matching blob names
+        """
+        if dates:
+            match_glob = "**_{" + ",".join(d.isoformat() for d in dates) + "}" + suffix
+        else:
+            match_glob = f"**{suffix}"
+
+        blobs = self._get_bucket(bucket_name).list_blobs(
+            prefix=prefix,
+            match_glob=match_glob,
+            fields="items(name),nextPageToken",
+        )
+        return [blob.name for blob in blobs if blob.name.endswith(suffix)]
+
+    def list_blob_update_times(
+        self, bucket_name: Union[str, Any], prefix: str
+    ) -> Dict[str, datetime]:
+        """
+        List the blobs under a prefix with their last update time.
+
+        A single paginated listing replaces one existence check per blob, and
+        only the name and update time of each blob are requested.
+
+        Args:
+            bucket_name: Name of the GCS bucket (can be enum or string)
+            prefix: Folder prefix to list (e.g., 'nba/games/2025/')
+
+        Returns:
+            Dictionary mapping blob names to their last update time (UTC)
+        """
+        blobs = self._get_bucket(bucket_name).list_blobs(
+            prefix=prefix, fields="items(name,updated),nextPageToken"
+        )
+        return {blob.name: blob.updated for blob in blobs}
+
     def list_historical_events_files(
-        self, bucket_name: str, catalog: str, table: str, season: str
+        self,
+        bucket_name: str,
+        catalog: str,
+        table: str,
+        season: str,
+        dates: Optional[List[date]] = None,
     ) -> List[str]:
         """
         List all historical events files in the GCS folder.
@@ -522,22 +804,15 @@ class SmartbettingLib:
             catalog: Data catalog (e.g., 'odds')
             table: Table name (e.g., 'historical_events')
             season: Season identifier (e.g., 'season_2024')
+            dates: Optional dates; if given, only the files of these dates are listed
 
         Returns:
             List of file names (blob names) in the historical_events folder
         """
         try:
-            storage_client = storage.Client()
-            bucket = storage_client.bucket(bucket_name)
-
             # List all blobs in the historical_events folder
             prefix = f"{catalog}/{table}/{season}/"
-            blobs = bucket.list_blobs(prefix=prefix)
-
-            file_names = []
-            for blob in blobs:
-                if blob.name.endswith(".json"):
-                    file_names.append(blob.name)
+            file_names = self._list_blob_names(bucket_name, prefix, ".json", dates)
 
             print(f"Found {len(file_names)} historical events files")
             return file_names
@@ -546,6 +821,46 @@ class SmartbettingLib:
             print(f"Error listing historical events files: {e}")
             return []
 
+    def _parse_ndjson(self, content: bytes, file_name: str) -> List[Dict[str, Any]]:
+        """
+        Parse NDJSON bytes into a list of objects.
+
+        Valid files are parsed in a tight loop with no per-line exception
+        handling. If any line is malformed, the file is re-parsed line by line,
+        logging and skipping the bad lines.
+
+        Args:
+            content: Raw NDJSON file content
+            file_name: Name of the source file, used in log messages
+
+        Returns:
+            List of parsed objects
+        """
+        lines = content.strip().split(b"\n")
+
+        # Fast path: no try-block setup per line
+        records: List[Dict[str, Any]] = []
+        append = records.append
+        loads = orjson.loads
+        try:
+            for line in lines:
+                if line:
+                    append(loads(line))
+            return records
+        except orjson.JSONDecodeError:
+            pass
+
+        # Slow path: skip and log malformed lines
+        records = []
+        for line in lines:
+            if line.strip():  # Skip empty lines
+                try:
+                    records.append(orjson.loads(line))
+                except orjson.JSONDecodeError as json_err:
+                    print(f"Error parsing JSON line in {file_name}: {json_err}")
+                    continue
+        return records
+
     def read_historical_events_file(
         self, bucket_name: str, file_name: str
     ) -> List[Dict[str, Any]]:
@@ -562,23 +877,14 @@ class SmartbettingLib:
             List of event dictionaries from the file
         """
         try:
-            storage_client = storage.Client()
-            bucket = storage_client.bucket(bucket_name)
+            bucket = self._get_bucket(bucket_name)
             blob = bucket.blob(file_name)
 
-            # Download content as text
-            content = blob.download_as_text()
+            # Download raw bytes (orjson parses UTF-8 bytes directly)
+            content = blob.download_as_bytes()
 
             # Parse NDJSON format (one JSON object per line)
-            events_data = []
-            for line in content.strip().split("\n"):
-                if line.strip():  # Skip empty lines
-                    try:
-                        event = json.loads(line)
-                        events_data.append(event)
-                    except json.JSONDecodeError as json_err:
-                        print(f"Error parsing JSON line in {file_name}: {json_err}")
-                        continue
+            events_data = self._parse_ndjson(content, file_name)
 
             print(f"Successfully read {len(events_data)} events from {file_name}")
             return events_data
@@ -587,6 +893,119 @@ class SmartbettingLib:
             print(f"Error reading file {file_name}: {e}")
             return []
 
+    def _filter_files_by_date(
+        self,
+        file_names: List[str],
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> List[str]:
+        """
+        Keep only the files whose name date falls inside the given range.
+
+        Files without a parseable YYYY-MM-DD suffix are dropped.
+
+        Args:
+            file_names: GCS blob names ending in _YYYY-MM-DD.json
+            start_date: Optional start date filter (inclusive)
+            end_date: Optional end date filter (inclusive)
+
+        Returns:
+            Filtered list of blob names, in the original order
+        """
+        filtered_files = []
+        for file_name in file_names:
+            match = FILE_DATE_PATTERN.search(file_name)
+            if not match:
+                continue
+            try:
+                file_date = date.fromisoformat(match.group(1))
+            except ValueError:
+                continue
+
+            if start_date and file_date < start_date:
+                continue
+            if end_date and file_date > end_date:
+                continue
+
+            filtered_files.append(file_name)
+
+        return filtered_files
+
+    def _extract_event_ids(
+        self,
+        list_fn: Callable[..., List[str]],
+        read_fn: Callable[[str, str], List[Dict[str, Any]]],
+        bucket_name: str,
+        catalog: str,
+        table: str,
+        season: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        label: str = "events",
+        max_workers: int = 8,
+    ) -> Dict[str, str]:
+        """
+        Extract event IDs and commence times from a folder of NDJSON event files.
+
+        Lists the files with list_fn, filters them by the date in their name,
+        reads them concurrently with read_fn and merges the results in file order.
+        Bounded date ranges of up to MAX_GLOB_DATES days are filtered by GCS
+        while listing; other ranges are filtered on the listed names.
+
+        Args:
+            list_fn: Function returning the blob names for (bucket, catalog, table,
+                season), accepting an optional dates keyword to filter by date
+            read_fn: Function returning the parsed events for (bucket, file_name)
+            bucket_name: GCS bucket name
+            catalog: Data catalog (e.g., 'odds')
+            table: Table name (e.g., 'events')
+            season: Season identifier (e.g., 'season_2024')
+            start_date: Optional start date filter (inclusive)
+            end_date: Optional end date filter (inclusive)
+            label: Description of the source used in log messages
+            max_workers: Maximum number of concurrent file reads
+
+        Returns:
+            Dictionary mapping event ID to commence time
+        """
+        print(f"🚀 Extracting event IDs from {label} data...")
+
+        dates = None
+        if start_date and end_date:
+            dates = daterange(start_date, end_date)
+            if not dates or len(dates) > MAX_GLOB_DATES:
+                dates = None
+
+        file_names = list_fn(bucket_name, catalog, table, season, dates=dates)
+        if not file_names:
+            print(f"No {label} files found")
+            return {}
+
+        if (start_date or end_date) and dates is None:
+            file_names = self._filter_files_by_date(file_names, start_date, end_date)
+            print(f"Filtered to {len(file_names)} files based on date range")
+
+        event_data: Dict[str, str] = {}
+        total_events = 0
+
+        # Reads are network bound, so fan them out; map() keeps file order
+        workers = max(1, min(max_workers, len(file_names)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for events in executor.map(
+                lambda file_name: read_fn(bucket_name, file_name), file_names
+            ):
+                for event in events:
+                    event_id = event.get("id")
+                    commence_time = event.get("commence_time")
+                    if event_id and commence_time:
+                        event_data[event_id] = commence_time
+                        total_events += 1
+
+        print(
+            f"✅ Extracted {len(event_data)} unique event IDs from {total_events} total {label}"
+        )
+        return event_data
+
     def extract_event_ids_from_historical_data(
         self,
         bucket_name: str,
@@ -613,56 +1032,17 @@ class SmartbettingLib:
         Returns:
             Dictionary mapping event ID to commence time
         """
-        print("🚀 Extracting event IDs from historical data...")
-
-        # List all files
-        file_names = self.list_historical_events_files(
-            bucket_name, catalog, table, season
+        return self._extract_event_ids(
+            self.list_historical_events_files,
+            self.read_historical_events_file,
+            bucket_name,
+            catalog,
+            table,
+            season,
+            start_date,
+            end_date,
+            label="historical events",
         )
-        if not file_names:
-            print("No historical events files found")
-            return {}
-
-        # Filter files by date if specified
-        if start_date or end_date:
-            filtered_files = []
-            for file_name in file_names:
-                # Extract date from filename: raw_odds_historical_events_YYYY-MM-DD.json
-                try:
-                    # Split filename and get the date part
-                    date_str = file_name.split("_")[-1].replace(".json", "")
-                    file_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-
-                    if start_date and file_date < start_date:
-                        continue
-                    if end_date and file_date > end_date:
-                        continue
-
-                    filtered_files.append(file_name)
-                except ValueError:
-                    continue
-
-            file_names = filtered_files
-            print(f"Filtered to {len(file_names)} files based on date range")
-
-        # Extract event data from all files
-        event_data = {}
-        total_events = 0
-
-        for file_name in file_names:
-            events_data = self.read_historical_events_file(bucket_name, file_name)
-
-            for event in events_data:
-                event_id = event.get("id")
-                commence_time = event.get("commence_time")
-                if event_id and commence_time:
-                    event_data[event_id] = commence_time
-                    total_events += 1
-
-        print(
-            f"✅ Extracted {len(event_data)} unique event IDs from {total_events} total events"
-        )
-        return event_data
 
     # ========================================================================================
     # CURRENT EVENTS DATA HELPERS (non-historical)
@@ -684,21 +1064,21 @@ class SmartbettingLib:
         return f"{catalog}/{table}/{season}/{file_name}"
 
     def list_events_files(
-        self, bucket_name: str, catalog: str, table: str, season: str
+        self,
+        bucket_name: str,
+        catalog: str,
+        table: str,
+        season: str,
+        dates: Optional[List[date]] = None,
     ) -> List[str]:
         """
         List all current events files in the GCS folder.
+
+        If dates are given, only the files of these dates are listed.
         """
         try:
-            storage_client = storage.Client()
-            bucket = storage_client.bucket(bucket_name)
             prefix = f"{catalog}/{table}/{season}/"
-            blobs = bucket.list_blobs(prefix=prefix)
-            file_names: List[str] = []
-            for blob in blobs:
-                if blob.name.endswith(".json"):
-                    file_names.append(blob.name)
-            return file_names
+            return self._list_blob_names(bucket_name, prefix, ".json", dates)
         except Exception as e:
             print(f"Error listing events files: {e}")
             return []
@@ -710,19 +1090,10 @@ class SmartbettingLib:
         Read a single events file (NDJSON) from GCS and parse it.
         """
         try:
-            storage_client = storage.Client()
-            bucket = storage_client.bucket(bucket_name)
+            bucket = self._get_bucket(bucket_name)
             blob = bucket.blob(file_name)
-            content = blob.download_as_text()
-            events_data: List[Dict[str, Any]] = []
-            for line in content.strip().split("\n"):
-                if line.strip():
-                    try:
-                        events_data.append(json.loads(line))
-                    except json.JSONDecodeError as json_err:
-                        print(f"Error parsing JSON line in {file_name}: {json_err}")
-                        continue
-            return events_data
+            content = blob.download_as_bytes()
+            return self._parse_ndjson(content, file_name)
         except Exception as e:
             print(f"Error reading events file {file_name}: {e}")
             return []
@@ -786,42 +1157,17 @@ class SmartbettingLib:
         """
         Extract event IDs and commence times from current events files in GCS.
         """
-        print("🚀 Extracting event IDs from current events data...")
-        file_names = self.list_events_files(bucket_name, catalog, table, season)
-        if not file_names:
-            print("No events files found")
-            return {}
-
-        # Filter files by date if specified
-        if start_date or end_date:
-            filtered_files: List[str] = []
-            for file_name in file_names:
-                try:
-                    date_str = file_name.split("_")[-1].replace(".json", "")
-                    file_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-                    if start_date and file_date < start_date:
-                        continue
-                    if end_date and file_date > end_date:
-                        continue
-                    filtered_files.append(file_name)
-                except ValueError:
-                    continue
-            file_names = filtered_files
-
-        event_data: Dict[str, str] = {}
-        total_events = 0
-        for file_name in file_names:
-            events = self.read_events_file(bucket_name, file_name)
-            for event in events:
-                event_id = event.get("id")
-                commence_time = event.get("commence_time")
-                if event_id and commence_time:
-                    event_data[event_id] = commence_time
-                    total_events += 1
-        print(
-            f"✅ Extracted {len(event_data)} unique event IDs from {total_events} total current events"
+        return self._extract_event_ids(
+            self.list_events_files,
+            self.read_events_file,
+            bucket_name,
+            catalog,
+            table,
+            season,
+            start_date,
+            end_date,
+            label="current events",
         )
-        return event_data
 
     def save_event_ids_to_storage(
         self,
@@ -854,16 +1200,14 @@ class SmartbettingLib:
         gcs_path = f"{catalog}/{table}/{season}/{filename}"
 
         try:
-            storage_client = storage.Client()
-            bucket = storage_client.bucket(bucket_name)
-            blob = bucket.blob(gcs_path)
-
             data = {
                 "extraction_date": date.today().isoformat(),
                 "total_events": len(event_data),
+                # IDs are unique, so sorting the keys alone gives the same
+                # order without comparing (id, commence_time) tuples
                 "events": [
-                    {"id": event_id, "commence_time": commence_time}
-                    for event_id, commence_time in sorted(event_data.items())
+                    {"id": event_id, "commence_time": event_data[event_id]}
+                    for event_id in sorted(event_data)
                 ],
                 "metadata": {
                     "source": "events",
@@ -872,9 +1216,8 @@ class SmartbettingLib:
                 },
             }
 
-            blob.upload_from_string(
-                json.dumps(data, indent=2, ensure_ascii=False),
-                content_type="application/json",
+            self.upload_json_to_gcs(
+                orjson.dumps(data, option=orjson.OPT_INDENT_2), bucket_name, gcs_path
             )
 
             print(f"✅ Saved {len(event_data)} events to GCS")
@@ -912,17 +1255,11 @@ class SmartbettingLib:
         print(f"🚀 Reading event IDs from storage ({catalog}/{table}/{season})...")
 
         try:
-            storage_client = storage.Client()
-            bucket = storage_client.bucket(bucket_name)
+            bucket = self._get_bucket(bucket_name)
 
             # List all event_id files
             prefix = f"{catalog}/{table}/{season}/"
-            blobs = bucket.list_blobs(prefix=prefix)
-
-            file_names = []
-            for blob in blobs:
-                if blob.name.endswith(".json"):
-                    file_names.append(blob.name)
+            file_names = self._list_blob_names(bucket_name, prefix, ".json")
 
             if not file_names:
                 print("No event_id files found")
@@ -952,8 +1289,7 @@ class SmartbettingLib:
             for file_name in file_names:
                 try:
                     blob = bucket.blob(file_name)
-                    content = blob.download_as_text()
-                    data = json.loads(content)
+                    data = orjson.loads(blob.download_as_bytes())
 
                     # Extract events from the structured format
                     if "events" in data:
@@ -992,10 +1328,10 @@ class SmartbettingLib:
         Returns:
             Lista de nomes dos arquivos PDF filtrados por datas
         """
-        storage_client = storage.Client()
-        bucket = storage_client.bucket(bucket_name)
+        bucket = self._get_bucket(bucket_name)
 
-        blobs = bucket.list_blobs(prefix=prefix)
+        # Only blob names are needed; skip the rest of the metadata
+        blobs = bucket.list_blobs(prefix=prefix, fields="items(name),nextPageToken")
         all_pdf_files = [
             blob.name for blob in blobs if blob.name.lower().endswith(".pdf")
         ]
@@ -1033,8 +1369,7 @@ class SmartbettingLib:
             True se sucesso, False caso contrário
         """
         try:
-            storage_client = storage.Client()
-            bucket = storage_client.bucket(bucket_name)
+            bucket = self._get_bucket(bucket_name)
             blob = bucket.blob(blob_name)
 
             blob.download_to_filename(local_path)
@@ -1067,10 +1402,9 @@ class SmartbettingLib:
             bool: True se sucesso, False caso contrário
         """
         try:
-            import tempfile
             import os
             import gc
-            from lib_dev.pdfextractor import PDFTableExtractor
+            import multiprocessing
 
             # Configurar prefixo e paths
             pdf_prefix = f"{catalog}/{table}/{season}/"
@@ -1095,79 +1429,67 @@ class SmartbettingLib:
             print(f"📁 Total de PDFs encontrados: {len(all_pdf_files)}")
 
             # 2. Processar todos os PDFs: extrair dados de cada PDF
-            all_dataframes = []
+            all_dataframes: List[Optional[pd.DataFrame]] = [None] * len(all_pdf_files)
             error_stats = {
                 "download_errors": 0,
                 "extraction_errors": 0,
                 "bigquery_errors": 0,
             }
             failed_files = []
+            row_offset = 0
 
             print(f"📥 Extraindo dados dos {len(all_pdf_files)} PDFs...")
 
-            for i, pdf_file in enumerate(all_pdf_files, 1):
-                filename = pdf_file.split("/")[-1]
-                print(f"[{i}/{len(all_pdf_files)}] {filename}", end="")
+            # Extração em paralelo: cada PDF é baixado e processado em um
+            # processo separado (spawn evita herdar o estado do cliente GCS)
+            max_workers = min(os.cpu_count() or 1, 8)
+            chunksize = max(1, min(4, len(all_pdf_files) // max_workers))
+            tasks = [(bucket_name, pdf_file) for pdf_file in all_pdf_files]
 
-                # Criar arquivo temporário
-                with tempfile.NamedTemporaryFile(
-                    suffix=".pdf", delete=False
-                ) as temp_file:
-                    temp_path = temp_file.name
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor:
+                results = executor.map(_extract_one_pdf, tasks, chunksize=chunksize)
 
-                try:
-                    # Baixar do GCS
-                    if not self.download_pdf_from_gcs(bucket_name, pdf_file, temp_path):
+                for i, (pdf_file, df, error_type, error_msg) in enumerate(results, 1):
+                    filename = pdf_file.split("/")[-1]
+                    print(f"[{i}/{len(all_pdf_files)}] {filename}", end="")
+
+                    if error_type == "download_errors":
                         print(" ❌ Download")
-                        error_stats["download_errors"] += 1
-                        failed_files.append(filename)
-                        continue
-
-                    # Extrair dados PDF
-                    try:
-                        extractor = PDFTableExtractor(temp_path)
-                        df = extractor.get_all_players_from_pdf()
-
-                        if df.empty:
-                            print(" ⚠️ 0 linhas extraídas")
-                        else:
-                            df = extractor.sanitize_column_names(df)
-
-                            # Verificar se coluna current_status está presente
-                            if "current_status" in df.columns:
-                                status_found = df["current_status"].value_counts()
-                                print(
-                                    f" 🔍 Status detectados: {len(status_found)} tipos diferentes"
-                                )
-                            else:
-                                print(" ⚠️ Coluna 'current_status' não encontrada!")
-
-                            # Adicionar metadados do arquivo fonte
-                            df["source_file"] = pdf_file
-                            df["row_order"] = range(1, len(df) + 1)
-
-                            # Acumular DataFrame
-                            all_dataframes.append(df)
-                            print(f" ✅ {len(df)} linhas extraídas")
-
-                        # Limpeza explícita de memória
-                        del df
-                        del extractor
-
-                    except Exception as e:
-                        error_msg = str(e)
+                    elif error_type == "extraction_errors":
                         print(f" ❌ Extração: {error_msg[:50]}...")
-                        error_stats["extraction_errors"] += 1
+                    elif df.empty:
+                        print(" ⚠️ 0 linhas extraídas")
+                    else:
+                        # Verificar se coluna current_status está presente
+                        if "current_status" not in df.columns:
+                            print(" ⚠️ Coluna 'current_status' não encontrada!")
+                        elif self.verbose:
+                            status_count = df["current_status"].nunique()
+                            print(f" 🔍 Status detectados: {status_count} tipos diferentes")
+
+                        # row_order global: cada PDF recebe sua fatia da sequência
+                        row_count = len(df)
+                        df["row_order"] = np.arange(
+                            row_offset + 1, row_offset + 1 + row_count, dtype=np.int64
+                        )
+                        row_offset += row_count
+
+                        # Acumular DataFrame na posição do arquivo
+                        all_dataframes[i - 1] = df
+                        print(f" ✅ {len(df)} linhas extraídas")
+
+                    if error_type:
+                        error_stats[error_type] += 1
                         failed_files.append(filename)
 
-                finally:
-                    # Limpar arquivo temporário
-                    if os.path.exists(temp_path):
-                        os.unlink(temp_path)
+                    # Liberar referência local (contagem de referências libera o resto)
+                    del df
 
-                    # Limpeza adicional de memória a cada 5 arquivos
-                    if i % 5 == 0:
-                        gc.collect()
+            # Descartar posições de arquivos sem dados
+            all_dataframes = [df for df in all_dataframes if df is not None]
 
             # 3. Consolidar dados e inserir no BigQuery
             total_rows = 0
@@ -1179,11 +1501,28 @@ class SmartbettingLib:
                 )
 
                 try:
-                    # Consolidar todos os DataFrames
-                    combined_df = pd.concat(all_dataframes, ignore_index=True)
+                    # Consolidar todos os DataFrames (sem concat para um único PDF)
+                    if len(all_dataframes) == 1:
+                        combined_df = all_dataframes[0].reset_index(drop=True)
+                    else:
+                        # Concat via Arrow: junta os chunks sem a consolidação de
+                        # blocos do pd.concat; to_pandas unifica as categorias de
+                        # source_file
+                        tables = [
+                            pa.Table.from_pandas(df, preserve_index=False)
+                            for df in all_dataframes
+                        ]
+                        combined_df = pa.concat_tables(
+                            tables, promote_options="default"
+                        ).to_pandas()
+                        del tables
+
+                    # Reduzir colunas inteiras ao menor tipo que comporta os valores
+                    for column in combined_df.select_dtypes(include="int64").columns:
+                        combined_df[column] = pd.to_numeric(
+                            combined_df[column], downcast="integer"
+                        )
 
-                    # Recalcular row_order global
-                    combined_df["row_order"] = range(1, len(combined_df) + 1)
                     total_rows = len(combined_df)
 
                     # Inserir tudo no BigQuery de uma vez
@@ -1230,3 +1569,64 @@ class SmartbettingLib:
         except Exception as e:
             print(f"❌ Erro no processamento: {e}")
             return False
+
+
+def _extract_one_pdf(
+    task: Tuple[str, str],
+) -> Tuple[str, Optional[pd.DataFrame], Optional[str], Optional[str]]:
+    """
+    Baixa um PDF de injury report do GCS e extrai seus dados.
+
+    Função de nível de módulo para poder ser usada pelo ProcessPoolExecutor
+    em process_injury_report_pdfs.
+
+    Args:
+        task: Tupla (bucket_name, pdf_file) com o bucket e o blob do PDF
+
+    Returns:
+        Tupla (pdf_file, df, error_type, error_msg). error_type é None em caso
+        de sucesso, ou "download_errors"/"extraction_errors" em caso de falha.
+    """
+    import tempfile
+    import os
+    from lib_dev.pdfextractor import PDFTableExtractor
+
+    bucket_name, pdf_file = task
+
+    # Criar arquivo temporário (em memória via /dev/shm quando disponível;
+    # o camelot precisa de um caminho, então não dá para usar um stream)
+    temp_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+    with tempfile.NamedTemporaryFile(
+        suffix=".pdf", delete=False, dir=temp_dir
+    ) as temp_file:
+        temp_path = temp_file.name
+
+    try:
+        # Baixar do GCS
+        if not SmartbettingLib().download_pdf_from_gcs(bucket_name, pdf_file, temp_path):
+            return pdf_file, None, "download_errors", None
+
+        # Extrair dados PDF
+        try:
+            extractor = PDFTableExtractor(temp_path)
+            df = extractor.get_all_players_from_pdf()
+
+            if not df.empty:
+                df = extractor.sanitize_column_names(df)
+
+                # Adicionar metadados do arquivo fonte (categórico: um valor por PDF)
+                df["source_file"] = pd.Categorical(
+                    [pdf_file] * len(df), categories=[pdf_file]
+                )
+
+            return pdf_file, df, None, None
+
+        except Exception as e:
+            return pdf_file, None, "extraction_errors", str(e)
+
+    finally:
+        # Limpar arquivo temporário
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
@@ -5,9 +5,12 @@ This module provides a wrapper around The Odds API for sports betting data retri
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Any, Dict, TypeVar, Callable
 
 
@@ -15,6 +18,30 @@ load_dotenv()
 
 T = TypeVar("T")
 
+# Read once at import; shared by every TheOddsAPILib instance
+_API_KEY = os.getenv("THEODDSAPI_API_KEY")
+
+
+def _build_session() -> requests.Session:
+    """
+    Build the HTTP session shared by every TheOddsAPILib instance.
+
+    Keeps connections warm and retries failed connections only. 429/5xx
+    responses are left to _handle_rate_limit_with_retry, so a single retry
+    layer decides how many quota-spending requests one call can make.
+
+    Returns:
+        Session with a pooled HTTPS adapter mounted
+    """
+    session = requests.Session()
+    retry = Retry(connect=3, read=0, status=0, backoff_factor=0.5)
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+    session.mount("https://", adapter)
+    return session
+
+
+_SESSION = _build_session()
+
 
 class TheOddsAPIException(Exception):
     """Base exception for The Odds API errors."""
@@ -64,6 +91,16 @@ class TheOddsAPILib:
     for retrieving sports betting data such as sports, odds, and events.
     """
 
+    # Log message prefix for each API exception type
+    _ERROR_MESSAGES: Dict[type, str] = {
+        AuthenticationError: "Invalid API key",
+        RateLimitError: "Rate limit exceeded",
+        ValidationError: "Invalid request parameters",
+        NotFoundError: "Resource not found",
+        ServerError: "API server error",
+        TheOddsAPIException: "General API error",
+    }
+
     def __init__(self) -> None:
         """
         Initialize The Odds API client.
@@ -74,13 +111,12 @@ class TheOddsAPILib:
         Raises:
             ValueError: If the API key is not found in environment variables
         """
-        api_key = os.getenv("THEODDSAPI_API_KEY")
-        if not api_key:
+        if not _API_KEY:
             raise ValueError("THEODDSAPI_API_KEY environment variable is required")
 
-        self.api_key = api_key
+        self.api_key = _API_KEY
         self.base_url = "https://api.the-odds-api.com/v4"
-        self.session = requests.Session()
+        self.session = _SESSION
 
     def _handle_api_exceptions(self, e: Exception, operation: str) -> None:
         """
@@ -90,32 +126,16 @@ class TheOddsAPILib:
             e: The exception that occurred
             operation: Description of the operation that failed
         """
-        if isinstance(e, AuthenticationError):
-            print(
-                f"Invalid API key during {operation}. Status: {e.status_code}, Details: {e.response_data}"
-            )
-        elif isinstance(e, RateLimitError):
-            print(
-                f"Rate limit exceeded during {operation}. Status: {e.status_code}, Details: {e.response_data}"
-            )
-        elif isinstance(e, ValidationError):
-            print(
-                f"Invalid request parameters during {operation}. Status: {e.status_code}, Details: {e.response_data}"
-            )
-        elif isinstance(e, NotFoundError):
-            print(
-                f"Resource not found during {operation}. Status: {e.status_code}, Details: {e.response_data}"
-            )
-        elif isinstance(e, ServerError):
-            print(
-                f"API server error during {operation}. Status: {e.status_code}, Details: {e.response_data}"
-            )
-        elif isinstance(e, TheOddsAPIException):
-            print(
-                f"General API error during {operation}. Status: {e.status_code}, Details: {e.response_data}"
-            )
-        else:
-            print(f"Unexpected error during {operation}: {str(e)}")
+        # Walk the MRO so subclasses fall back to their closest known parent
+        for exc_type in type(e).__mro__:
+            prefix = self._ERROR_MESSAGES.get(exc_type)
+            if prefix:
+                print(
+                    f"{prefix} during {operation}. Status: {e.status_code}, Details: {e.response_data}"
+                )
+                return
+
+        print(f"Unexpected error during {operation}: {str(e)}")
 
     def _handle_rate_limit_with_retry(
         self,
@@ -176,38 +196,52 @@ class TheOddsAPILib:
         Raises:
             Various API exceptions based on status code
         """
+        if response.status_code == 200:
+            return response.json()
+
+        # Error path: parse the body once and reuse it for the exception
+        payload = response.json() if response.content else {}
+
         if response.status_code == 401:
-            raise AuthenticationError(
-                "Invalid API key", 401, response.json() if response.content else {}
-            )
+            raise AuthenticationError("Invalid API key", 401, payload)
         elif response.status_code == 422:
-            raise ValidationError(
-                "Invalid request parameters",
-                422,
-                response.json() if response.content else {},
-            )
+            raise ValidationError("Invalid request parameters", 422, payload)
         elif response.status_code == 404:
-            raise NotFoundError(
-                "Resource not found", 404, response.json() if response.content else {}
-            )
+            raise NotFoundError("Resource not found", 404, payload)
         elif response.status_code == 429:
-            raise RateLimitError(
-                "Rate limit exceeded", 429, response.json() if response.content else {}
-            )
+            raise RateLimitError("Rate limit exceeded", 429, payload)
         elif response.status_code >= 500:
-            raise ServerError(
-                "Server error",
-                response.status_code,
-                response.json() if response.content else {},
-            )
-        elif response.status_code != 200:
-            raise TheOddsAPIException(
-                f"HTTP {response.status_code}",
-                response.status_code,
-                response.json() if response.content else {},
-            )
+            raise ServerError("Server error", response.status_code, payload)
+
+        raise TheOddsAPIException(
+            f"HTTP {response.status_code}", response.status_code, payload
+        )
 
-        return response.json()
+    def _build_params(
+        self, required: Dict[str, Any], optional: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Build query parameters in a single pass.
+
+        Required parameters are always sent as given, so invalid values still
+        surface as API errors. Unset optional values (None, empty strings and
+        False flags) are dropped and True flags are encoded as the string
+        'true' expected by the API.
+
+        Args:
+            required: Query parameters always sent, keyed by API parameter name
+            optional: Candidate query parameters keyed by API parameter name
+
+        Returns:
+            Query parameters to send with the request
+        """
+        params = dict(required)
+        params.update(
+            (key, "true" if value is True else value)
+            for key, value in optional.items()
+            if value
+        )
+        return params
 
     def _make_request(
         self,
@@ -325,28 +359,23 @@ class TheOddsAPILib:
                 f"Expected API cost: {expected_cost} credits ({market_count} markets × {region_count} regions)"
             )
 
-            params = {
-                "regions": regions,
-                "dateFormat": date_format,
-                "oddsFormat": odds_format,
-            }
-
-            if markets:
-                params["markets"] = markets
-            if event_ids:
-                params["eventIds"] = event_ids
-            if bookmakers:
-                params["bookmakers"] = bookmakers
-            if commence_time_from:
-                params["commenceTimeFrom"] = commence_time_from
-            if commence_time_to:
-                params["commenceTimeTo"] = commence_time_to
-            if include_links:
-                params["includeLinks"] = "true"
-            if include_sids:
-                params["includeSids"] = "true"
-            if include_bet_limits:
-                params["includeBetLimits"] = "true"
+            params = self._build_params(
+                {
+                    "regions": regions,
+                    "dateFormat": date_format,
+                    "oddsFormat": odds_format,
+                },
+                {
+                    "markets": markets,
+                    "eventIds": event_ids,
+                    "bookmakers": bookmakers,
+                    "commenceTimeFrom": commence_time_from,
+                    "commenceTimeTo": commence_time_to,
+                    "includeLinks": include_links,
+                    "includeSids": include_sids,
+                    "includeBetLimits": include_bet_limits,
+                },
+            )
 
             def fetch_odds():
                 return self._make_request(f"/sports/{sport}/odds/", params, "get_odds")
@@ -366,6 +395,31 @@ class TheOddsAPILib:
             self._handle_api_exceptions(e, "get_odds")
             return None
 
+    def get_odds_many(
+        self, sports: List[str], max_workers: int = 8, **kwargs: Any
+    ) -> Dict[str, Optional[List[Dict[str, Any]]]]:
+        """
+        Get odds for several sports concurrently.
+
+        Requests are issued from a thread pool through the shared session,
+        which only retries failed connections. 429 responses are retried with
+        backoff by get_odds itself; 5xx responses are not retried.
+
+        Args:
+            sports: List of sport keys (e.g., ['basketball_nba', 'americanfootball_nfl'])
+            max_workers: Maximum number of concurrent requests. Defaults to 8
+            **kwargs: Additional arguments forwarded to get_odds
+
+        Returns:
+            Dictionary mapping each sport key to its get_odds result
+        """
+        if not sports:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(sports))) as executor:
+            results = executor.map(lambda sport: self.get_odds(sport, **kwargs), sports)
+            return dict(zip(sports, results))
+
     def get_participants(self, sport: str) -> Optional[List[Dict[str, Any]]]:
         """
         Get participants (teams/players) for a specific sport.
@@ -412,14 +466,15 @@ class TheOddsAPILib:
         try:
             print(f"Getting events for sport: {sport}")
 
-            params: Dict[str, Any] = {
-                "dateFormat": date_format,
-            }
-
-            if commence_time_from:
-                params["commenceTimeFrom"] = commence_time_from
-            if commence_time_to:
-                params["commenceTimeTo"] = commence_time_to
+            params = self._build_params(
+                {
+                    "dateFormat": date_format,
+                },
+                {
+                    "commenceTimeFrom": commence_time_from,
+                    "commenceTimeTo": commence_time_to,
+                },
+            )
 
             events_data = self._make_request(
                 f"/sports/{sport}/events", params, "get_events"
@@ -466,22 +521,20 @@ class TheOddsAPILib:
         try:
             print(f"Getting event odds for event {event_id} ({sport})")
 
-            params: Dict[str, Any] = {
-                "regions": regions,
-                "dateFormat": date_format,
-                "oddsFormat": odds_format,
-            }
-
-            if markets:
-                params["markets"] = markets
-            if bookmakers:
-                params["bookmakers"] = bookmakers
-            if include_links:
-                params["includeLinks"] = "true"
-            if include_sids:
-                params["includeSids"] = "true"
-            if include_bet_limits:
-                params["includeBetLimits"] = "true"
+            params = self._build_params(
+                {
+                    "regions": regions,
+                    "dateFormat": date_format,
+                    "oddsFormat": odds_format,
+                },
+                {
+                    "markets": markets,
+                    "bookmakers": bookmakers,
+                    "includeLinks": include_links,
+                    "includeSids": include_sids,
+                    "includeBetLimits": include_bet_limits,
+                },
+            )
 
             event_odds = self._make_request(
                 f"/sports/{sport}/events/{event_id}/odds",
@@ -546,29 +599,24 @@ class TheOddsAPILib:
         try:
             print(f"Getting historical odds for sport: {sport} at {date}")
 
-            params = {
-                "regions": regions,
-                "date": date,
-                "dateFormat": date_format,
-                "oddsFormat": odds_format,
-            }
-
-            if markets:
-                params["markets"] = markets
-            if event_ids:
-                params["eventIds"] = event_ids
-            if bookmakers:
-                params["bookmakers"] = bookmakers
-            if commence_time_from:
-                params["commenceTimeFrom"] = commence_time_from
-            if commence_time_to:
-                params["commenceTimeTo"] = commence_time_to
-            if include_links:
-                params["includeLinks"] = "true"
-            if include_sids:
-                params["includeSids"] = "true"
-            if include_bet_limits:
-                params["includeBetLimits"] = "true"
+            params = self._build_params(
+                {
+                    "regions": regions,
+                    "date": date,
+                    "dateFormat": date_format,
+                    "oddsFormat": odds_format,
+                },
+                {
+                    "markets": markets,
+                    "eventIds": event_ids,
+                    "bookmakers": bookmakers,
+                    "commenceTimeFrom": commence_time_from,
+                    "commenceTimeTo": commence_time_to,
+                    "includeLinks": include_links,
+                    "includeSids": include_sids,
+                    "includeBetLimits": include_bet_limits,
+                },
+            )
 
             historical_data = self._make_request(
                 f"/historical/sports/{sport}/odds", params, "get_historical_odds"
@@ -613,17 +661,17 @@ class TheOddsAPILib:
         try:
             print(f"Getting historical events for sport: {sport} at {date}")
 
-            params = {
-                "date": date,
-                "dateFormat": date_format,
-            }
-
-            if event_ids:
-                params["eventIds"] = event_ids
-            if commence_time_from:
-                params["commenceTimeFrom"] = commence_time_from
-            if commence_time_to:
-                params["commenceTimeTo"] = commence_time_to
+            params = self._build_params(
+                {
+                    "date": date,
+                    "dateFormat": date_format,
+                },
+                {
+                    "eventIds": event_ids,
+                    "commenceTimeFrom": commence_time_from,
+                    "commenceTimeTo": commence_time_to,
+                },
+            )
 
             historical_events = self._make_request(
                 f"/historical/sports/{sport}/events", params, "get_historical_events"
@@ -672,17 +720,18 @@ class TheOddsAPILib:
         try:
             print(f"Getting historical odds for event {event_id} at {date}")
 
-            params = {
-                "regions": regions,
-                "date": date,
-                "dateFormat": date_format,
-                "oddsFormat": odds_format,
-            }
-
-            if markets:
-                params["markets"] = markets
-            if bookmakers:
-                params["bookmakers"] = bookmakers
+            params = self._build_params(
+                {
+                    "regions": regions,
+                    "date": date,
+                    "dateFormat": date_format,
+                    "oddsFormat": odds_format,
+                },
+                {
+                    "markets": markets,
+                    "bookmakers": bookmakers,
+                },
+            )
 
             historical_odds = self._make_request(
                 f"/historical/sports/{sport}/events/{event_id}/odds",
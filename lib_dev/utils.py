@@ -1,11 +1,20 @@
 """
-Utility enums for the Smartbetting project.
+Utility enums and helpers for the Smartbetting project.
 
 This module contains enumeration classes for defining constants used
-throughout the Smartbetting data pipeline.
+throughout the Smartbetting data pipeline, plus small shared helpers.
 """
 
-from enum import Enum
+import os
+import threading
+import time
+from collections import deque
+from datetime import date, timedelta
+from enum import Enum, IntEnum
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import orjson
 
 
 class Bucket(Enum):
@@ -25,7 +34,7 @@ class Bucket(Enum):
         Returns:
             String value of the bucket
         """
-        return "%s" % self.value
+        return self.value
 
 
 class Catalog(Enum):
@@ -46,7 +55,7 @@ class Catalog(Enum):
         Returns:
             String value of the catalog
         """
-        return "%s" % self.value
+        return self.value
 
 
 class Schema(Enum):
@@ -66,7 +75,7 @@ class Schema(Enum):
         Returns:
             String value of the schema
         """
-        return "%s" % self.value
+        return self.value
 
 
 class Table(Enum):
@@ -105,14 +114,15 @@ class Table(Enum):
         Returns:
             String value of the table
         """
-        return "%s" % self.value
+        return self.value
 
 
-class Season(Enum):
+class Season(IntEnum):
     """
     Season enumeration.
 
-    Defines the available seasons for data processing.
+    Defines the available seasons for data processing. Members are ints,
+    so they can be used directly in arithmetic and date construction.
     """
 
     SEASON_2024 = 2024
@@ -127,4 +137,206 @@ class Season(Enum):
         Returns:
             String value of the table
         """
-        return "%s" % self.value
+        return str(self.value)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    Each API call takes one token, so concurrent workers share a single
+    request rate instead of each sleeping a fixed amount between calls.
+
+    Outcomes reported with ``record()`` make the rate adaptive: the refill
+    rate is divided by ``1 + penalty * rejected_share``, where
+    ``rejected_share`` is the share of rate-limited responses over the last
+    ``window`` seconds. The bucket slows down while the API pushes back and
+    returns to full speed once 429s stop.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: int = 1,
+        window: float = 60.0,
+        penalty: float = 5.0,
+    ) -> None:
+        """
+        Initialize the token bucket.
+
+        Args:
+            rate: Tokens added per second (sustained requests per second)
+            capacity: Maximum number of tokens, i.e. the allowed burst size
+            window: Seconds of reported outcomes used to adapt the rate
+            penalty: How strongly rate-limited responses slow the bucket down
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.window = window
+        self.penalty = penalty
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._outcomes: deque = deque()
+        self._rejected = 0
+        self._lock = threading.Lock()
+
+    def _expire_outcomes(self, now: float) -> None:
+        while self._outcomes and self._outcomes[0][0] < now - self.window:
+            _, accepted = self._outcomes.popleft()
+            if not accepted:
+                self._rejected -= 1
+
+    def _current_rate(self, now: float) -> float:
+        self._expire_outcomes(now)
+        if not self._rejected:
+            return self.rate
+        rejected_share = self._rejected / len(self._outcomes)
+        return self.rate / (1 + self.penalty * rejected_share)
+
+    def record(self, accepted: bool) -> None:
+        """
+        Report the outcome of an API call.
+
+        Args:
+            accepted: False if the call was rate limited (HTTP 429), else True
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._outcomes.append((now, accepted))
+            if not accepted:
+                self._rejected += 1
+            self._expire_outcomes(now)
+
+    def acquire(self) -> None:
+        """
+        Block until a token is available and take it.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                rate = self._current_rate(now)
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated_at) * rate
+                )
+                self._updated_at = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait_seconds = (1 - self._tokens) / rate
+
+            time.sleep(wait_seconds)
+
+
+# Data of a date is final once this many days have passed since it
+FINAL_AFTER_DAYS = 2
+
+
+def is_final(day: date) -> bool:
+    """
+    Tell whether the data of a date is final.
+
+    Box scores and stats keep being corrected for a while after a game, so a
+    date only counts as final FINAL_AFTER_DAYS days after it.
+
+    Args:
+        day: Date to check
+
+    Returns:
+        True if the data of the date should no longer change
+    """
+    return day <= date.today() - timedelta(days=FINAL_AFTER_DAYS)
+
+
+class DateCache:
+    """
+    Local disk cache of per-date API results.
+
+    Rows are stored as one NDJSON file per date under
+    ``$SMARTBETTING_CACHE_DIR/<endpoint>/`` (``~/.cache/smartbetting`` by
+    default). Only final dates (see is_final) with at least one row are
+    cached: recent data may still change and is always fetched again. Set
+    ``SMARTBETTING_CACHE_REFRESH=1`` or pass refresh=True to ignore the
+    cached entries and overwrite them with fresh data.
+    """
+
+    def __init__(self, endpoint: str, refresh: Optional[bool] = None) -> None:
+        """
+        Initialize the cache for an API endpoint.
+
+        Args:
+            endpoint: Name of the endpoint, used as the cache subdirectory
+            refresh: If True, get always misses so every date is fetched and
+                stored again. Defaults to the SMARTBETTING_CACHE_REFRESH
+                environment variable.
+        """
+        root = os.getenv("SMARTBETTING_CACHE_DIR", "~/.cache/smartbetting")
+        self.directory = Path(root).expanduser() / endpoint
+        if refresh is None:
+            refresh = os.getenv("SMARTBETTING_CACHE_REFRESH", "") not in ("", "0")
+        self.refresh = refresh
+
+    def _path(self, day: date) -> Path:
+        return self.directory / f"{day.isoformat()}.ndjson"
+
+    def get(self, day: date) -> Optional[List[Dict[str, Any]]]:
+        """
+        Return the cached rows of a date.
+
+        Args:
+            day: Date to look up
+
+        Returns:
+            List of cached rows, or None if the date is not cached or the
+            cache is being refreshed
+        """
+        if self.refresh or not is_final(day):
+            return None
+
+        try:
+            content = self._path(day).read_bytes()
+        except FileNotFoundError:
+            return None
+
+        return [orjson.loads(line) for line in content.splitlines()]
+
+    def put(self, day: date, rows: List[Dict[str, Any]]) -> None:
+        """
+        Store the rows of a date. Dates that are not final yet and empty
+        results are ignored, so they are fetched again on the next run.
+
+        Args:
+            day: Date the rows belong to
+            rows: List of dictionaries returned for that date
+        """
+        if not rows or not is_final(day):
+            return
+
+        path = self._path(day)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write then rename, so an interrupted run never leaves a partial entry
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(
+            b"".join(orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE) for row in rows)
+        )
+        tmp_path.replace(path)
+
+
+def daterange(start_date: date, end_date: date) -> List[date]:
+    """
+    List every date between two dates.
+
+    Args:
+        start_date: First date (inclusive)
+        end_date: Last date (inclusive)
+
+    Returns:
+        List of dates in ascending order, empty if end_date is before start_date
+    """
+    return [
+        start_date + timedelta(days=offset)
+        for offset in range((end_date - start_date).days + 1)
+    ]
@@ -0,0 +1,54 @@
+"""
+NBA landing pipelines runner.
+
+Runs the independent NBA landing pipeline scripts concurrently in a single
+process with ``python nba_dev/landing``. Each script builds its own API and
+storage clients, so they share no state besides the process-wide GCS client.
+"""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, NoReturn
+
+import active_players
+import season_averages
+import team_standings
+
+# Pipelines that fetch a single snapshot and can run side by side. The
+# date-range pipelines (games, game_player_stats) run on their own since
+# they already spread their requests over a thread pool.
+PIPELINES: Dict[str, Callable[[], None]] = {
+    "active_players": active_players.main,
+    "team_standings": team_standings.main,
+    "season_averages": season_averages.main,
+}
+
+
+def main() -> NoReturn:
+    """
+    Run all NBA landing pipelines concurrently.
+
+    Returns:
+        None
+
+    Raises:
+        SystemExit: With status 1 if any pipeline failed
+    """
+    with ThreadPoolExecutor(max_workers=len(PIPELINES)) as executor:
+        futures = {name: executor.submit(run) for name, run in PIPELINES.items()}
+
+    failed = []
+    for name, future in futures.items():
+        error = future.exception()
+        if error is None:
+            print(f"✅ {name} pipeline finished")
+        else:
+            print(f"❌ {name} pipeline failed: {str(error)}")
+            failed.append(name)
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,13 +5,8 @@ This script fetches active NBA players data from the Balldontlie API and uploads
 it to Google Cloud Storage in the landing layer of the data lake.
 """
 
-import sys
-import os
 from typing import NoReturn
 
-# Add the project root to the Python path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-
 from lib_dev.balldontlie import BalldontlieLib
 from lib_dev.smartbetting import SmartbettingLib
 from lib_dev.utils import Bucket, Catalog, Table, Season
@@ -69,7 +64,12 @@ def main() -> NoReturn:
         gcs_blob_name = (
             f"{catalog}/{table}/{season}/raw_{catalog}_{table}_{season}.json"
         )
-        smartbetting.upload_json_to_gcs(ndjson_data, bucket, gcs_blob_name)
+        smartbetting.upload_json_to_gcs(
+            ndjson_data,
+            bucket,
+            gcs_blob_name,
+            skip_if_unchanged=True,
+        )
 
         print(
             f"✅ Successfully processed and uploaded {len(data)} active players to Google Cloud Storage"
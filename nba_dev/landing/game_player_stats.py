@@ -1,22 +1,29 @@
 """
 NBA Game Player Stats data pipeline script.
 
-This script fetches NBA player stats data from the Balldontlie API for both specific dates
-and entire seasons, then uploads it to Google Cloud Storage in the landing layer.
+This script fetches NBA player stats data from the Balldontlie API for each date of
+the configured range, then uploads one file per date to Google Cloud Storage in the
+landing layer.
 """
 
-import sys
-import os
-import time
-from typing import NoReturn
-from datetime import date, timedelta
-
-# Add the project root to the Python path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from typing import Any, Dict, List, NoReturn, Optional, Set
+from datetime import date
 
 from lib_dev.balldontlie import BalldontlieLib
+from lib_dev.pipeline import PipelineConfig, pending_dates, run_daily_pipeline
 from lib_dev.smartbetting import SmartbettingLib
-from lib_dev.utils import Bucket, Catalog, Table, Season
+from lib_dev.utils import Bucket, Catalog, Table, Season, TokenBucket, DateCache
+
+# Number of dates fetched concurrently
+MAX_WORKERS = 4
+
+# Request rate shared by all workers. BalldontlieLib takes a token per page
+# and reports 429s to the limiter, which slows down while the API pushes back.
+API_REQUESTS_PER_SECOND = 1.0
+
+# Fewer pending dates than this are fetched directly: the schedule lookup
+# costs at least one paginated call and cannot save more than it spends
+MIN_DATES_FOR_SCHEDULE_LOOKUP = 3
 
 
 def main() -> NoReturn:
@@ -24,11 +31,14 @@ def main() -> NoReturn:
     Main function to execute the NBA game player stats data pipeline.
 
     This function:
-    1. Fetches player stats data from Balldontlie API for each day starting from 22/10/2024
-    2. Fetches player stats data for the entire 2024 season
+    1. Skips dates whose file was already uploaded once final (skip_existing)
+    2. Fetches player stats data from Balldontlie API for each remaining date
+       between the configured start and end dates
     3. Converts the data to the required format
-    4. Uploads the data to Google Cloud Storage in the landing layer
-    5. Includes longer delays between each date extraction to avoid rate limiting
+    4. Uploads the data to Google Cloud Storage in the landing layer, one file per date
+    5. Shares a token-bucket rate limit across workers to avoid rate limiting
+    6. Caches final dates on local disk so reruns do not hit the API again
+    7. Skips dates without games using a single schedule lookup
 
     Returns:
         None
@@ -38,19 +48,50 @@ def main() -> NoReturn:
         Exception: For any other unexpected errors during execution
     """
     # Initialize constants
-    bucket = Bucket.SMARTBETTING_STORAGE
-    catalog = Catalog.NBA
-    table = Table.GAME_PLAYER_STATS
     season = Season.SEASON_2025
-
-    # Set start date for daily extraction
-    # Use yesterday's date since today's games haven't finished yet
-    start_date = date(2025,11,28)  # 22/10/2024
-    end_date =date(2025,12,1)  # Today's date
+    cfg = PipelineConfig(
+        bucket=Bucket.SMARTBETTING_STORAGE,
+        catalog=Catalog.NBA,
+        table=Table.GAME_PLAYER_STATS,
+        season=season,
+        # Use yesterday's date since today's games haven't finished yet
+        start_date=date(2025, 11, 28),
+        end_date=date(2025, 12, 1),
+        label="player stats",
+        max_workers=MAX_WORKERS,
+        skip_existing=True,
+    )
+    start_date, end_date = cfg.start_date, cfg.end_date
 
     # Initialize API clients
-    balldontlie = BalldontlieLib()
+    rate_limiter = TokenBucket(rate=API_REQUESTS_PER_SECOND)
+    balldontlie = BalldontlieLib(rate_limiter=rate_limiter)
     smartbetting = SmartbettingLib()
+    cache = DateCache(str(cfg.table))
+
+    # Pending dates with at least one game (ISO format), None if unknown
+    game_dates: Optional[Set[str]] = None
+
+    def fetch_date(current_date: date) -> Optional[List[Dict[str, Any]]]:
+        """Fetch the player stats of a single date, using the local disk cache."""
+        # Days without games have no player stats to fetch
+        if game_dates is not None and current_date.isoformat() not in game_dates:
+            return []
+
+        # Final dates already fetched by an earlier run come from disk
+        data = cache.get(current_date)
+        if data is not None:
+            return data
+
+        response = balldontlie.get_stats(current_date)
+
+        if response is None:
+            return None
+
+        # Convert API response to dictionary format
+        data = smartbetting.convert_object_to_dict(response)
+        cache.put(current_date, data)
+        return data
 
     try:
         print("Starting NBA game player stats data pipeline")
@@ -63,50 +104,20 @@ def main() -> NoReturn:
         print("EXTRACTING PLAYER STATS BY DATE (DAILY)")
         print("=" * 60)
 
-        current_date = start_date
-        total_stats_by_date = 0
-
-        while current_date <= end_date:
-            print(f"\nProcessing player stats for date: {current_date}")
-
-            # Fetch player stats data from API for current date
-            response = balldontlie.get_stats(current_date)
-
-            if response is None:
-                print(f"No player stats data received for {current_date}")
-                current_date += timedelta(days=1)
-                # Add small delay even when no data
-                time.sleep(2)
-                continue
-
-            if len(response) == 0:
-                print(f"No player stats found for {current_date}")
-                current_date += timedelta(days=1)
-                # Add small delay even when no data
-                time.sleep(2)
-                continue
-
-            # Convert API response to dictionary format
-            data = smartbetting.convert_object_to_dict(response)
-
-            # Convert data to NDJSON format for BigQuery compatibility
-            ndjson_data = smartbetting.convert_to_ndjson(data)
-
-            # Upload NDJSON data to Google Cloud Storage (by date)
-            gcs_blob_name = f"{catalog}/{table}/{season}/raw_{catalog}_{table}_{current_date.strftime('%Y-%m-%d')}.json"
-            smartbetting.upload_json_to_gcs(ndjson_data, bucket, gcs_blob_name)
-
-            print(
-                f"✅ Successfully processed and uploaded {len(data)} player stats for {current_date}"
-            )
-            total_stats_by_date += len(data)
+        # Dates already uploaded once final are dropped before any API call
+        dates = pending_dates(cfg, smartbetting)
 
-            # Add moderate delay between date extractions
-            print("Waiting 5 seconds before processing next date...")
-            time.sleep(5)
+        # One schedule lookup over the pending dates instead of a stats call per off-day
+        if len(dates) >= MIN_DATES_FOR_SCHEDULE_LOOKUP:
+            games = balldontlie.get_games_by_date_range(dates[0], dates[-1])
+            if games is not None:
+                # The SDK returns game dates as ISO date strings (YYYY-MM-DD)
+                game_dates = {
+                    date.fromisoformat(game.date).isoformat() for game in games
+                }
+                print(f"Found games on {len(game_dates)} dates")
 
-            # Move to next date
-            current_date += timedelta(days=1)
+        total_stats_by_date = run_daily_pipeline(cfg, fetch_date, smartbetting, dates)
 
         print(
             f"\n📊 Daily extraction completed! Total player stats by date: {total_stats_by_date}"
@@ -1,29 +1,35 @@
 """
 NBA Games data pipeline script with datetime preservation.
 
-This script fetches NBA games data from the Balldontlie API for both specific dates
-and entire seasons, then uploads it to Google Cloud Storage in the landing layer.
+This script fetches NBA games data from the Balldontlie API for each date of the
+configured range, then uploads one file per date to Google Cloud Storage in the
+landing layer.
 """
 
-import sys
-import os
-from typing import NoReturn
-from datetime import date, timedelta
-
-# Add the project root to the Python path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from typing import Any, Dict, List, NoReturn, Optional
+from datetime import date
 
 from lib_dev.balldontlie import BalldontlieLib
+from lib_dev.pipeline import PipelineConfig, run_daily_pipeline
 from lib_dev.smartbetting import SmartbettingLib
-from lib_dev.utils import Bucket, Catalog, Table, Season
+from lib_dev.utils import Bucket, Catalog, Table, Season, TokenBucket
+
+# Number of dates fetched concurrently
+MAX_WORKERS = 4
+
+# Request rate shared by all workers. BalldontlieLib takes a token per page
+# and reports 429s to the limiter, which slows down while the API pushes back.
+API_REQUESTS_PER_SECOND = 1.0
 
 
 def main() -> NoReturn:
     """
     Main function to execute the NBA games data pipeline.
 
-    This function fetches games data by date using a datetime-preserving
-    method and uploads it to Google Cloud Storage in the landing layer.
+    This function fetches games data for each date between the configured
+    start and end dates using a datetime-preserving method and uploads it to
+    Google Cloud Storage in the landing layer. Dates whose file was already
+    uploaded once final (skip_existing) are skipped without calling the API.
 
     Returns:
         None
@@ -33,19 +39,30 @@ def main() -> NoReturn:
         Exception: For any other unexpected errors during execution
     """
     # Initialize constants
-    bucket = Bucket.SMARTBETTING_STORAGE
-    catalog = Catalog.NBA
-    table = Table.GAMES
     season = Season.SEASON_2025
-
-    # Set start date for daily extraction
-    start_date = date(2025,11,28)  # 22/10/2024
-    end_date =date(2025,12,1)  # Today's date
+    cfg = PipelineConfig(
+        bucket=Bucket.SMARTBETTING_STORAGE,
+        catalog=Catalog.NBA,
+        table=Table.GAMES,
+        season=season,
+        start_date=date(2025, 11, 28),
+        end_date=date(2025, 12, 1),
+        label="games",
+        max_workers=MAX_WORKERS,
+        skip_existing=True,
+    )
+    start_date, end_date = cfg.start_date, cfg.end_date
 
     # Initialize API clients
-    balldontlie = BalldontlieLib()
+    rate_limiter = TokenBucket(rate=API_REQUESTS_PER_SECOND)
+    balldontlie = BalldontlieLib(rate_limiter=rate_limiter)
     smartbetting = SmartbettingLib()
 
+    def fetch_date(current_date: date) -> Optional[List[Dict[str, Any]]]:
+        """Fetch the games of a single date with the datetime field preserved."""
+        # Data is already in dictionary format from get_games_with_datetime()
+        return balldontlie.get_games_with_datetime(current_date)
+
     try:
         print("Starting NBA games data pipeline")
         print(f"Season: {season}")
@@ -57,56 +74,7 @@ def main() -> NoReturn:
         print("EXTRACTING GAMES BY DATE (DAILY)")
         print("=" * 60)
 
-        current_date = start_date
-        total_games_by_date = 0
-
-        while current_date <= end_date:
-            print(f"\nProcessing games for date: {current_date}")
-
-            # Fetch games data using datetime-preserving method
-            response = balldontlie.get_games_with_datetime(current_date)
-
-            if response is None:
-                print(f"No games data received for {current_date}")
-                current_date += timedelta(days=1)
-                continue
-
-            if len(response) == 0:
-                print(f"No games found for {current_date}")
-                current_date += timedelta(days=1)
-                continue
-
-            # Verify datetime field is present
-            games_with_datetime = [g for g in response if g.get("datetime")]
-            games_without_datetime = [g for g in response if not g.get("datetime")]
-
-            print(f"Found {len(response)} games for {current_date}")
-            print(f"  Games with datetime: {len(games_with_datetime)}")
-            print(f"  Games without datetime: {len(games_without_datetime)}")
-
-            if games_with_datetime:
-                # Show example of datetime field
-                example_game = games_with_datetime[0]
-                print(f"  Example datetime: {example_game.get('datetime')}")
-
-            # Data is already in dictionary format from get_games_with_datetime()
-            # No need to convert since we're using direct requests
-            data = response
-
-            # Convert data to NDJSON format for BigQuery compatibility
-            ndjson_data = smartbetting.convert_to_ndjson(data)
-
-            # Upload NDJSON data to Google Cloud Storage (by date)
-            gcs_blob_name = f"{catalog}/{table}/{season}/raw_{catalog}_{table}_{current_date.strftime('%Y-%m-%d')}.json"
-            smartbetting.upload_json_to_gcs(ndjson_data, bucket, gcs_blob_name)
-
-            print(
-                f"✅ Successfully processed and uploaded {len(data)} games for {current_date}"
-            )
-            total_games_by_date += len(data)
-
-            # Move to next date
-            current_date += timedelta(days=1)
+        total_games_by_date = run_daily_pipeline(cfg, fetch_date, smartbetting)
 
         print(
             f"\n📊 Daily extraction completed! Total games by date: {total_games_by_date}"
@@ -5,17 +5,22 @@ This script fetches NBA season averages data from the Balldontlie API for all
 category/type combinations and uploads it to Google Cloud Storage in the landing layer.
 """
 
-import sys
-import os
-import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import NoReturn
 
-# Add the project root to the Python path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-
 from lib_dev.balldontlie import BalldontlieLib
 from lib_dev.smartbetting import SmartbettingLib
-from lib_dev.utils import Bucket, Catalog, Table, Season
+from lib_dev.utils import Bucket, Catalog, Table, Season, TokenBucket
+
+# Number of combinations fetched concurrently
+MAX_WORKERS = 4
+
+# Request rate shared by all workers. BalldontlieLib takes a token per page
+# and reports 429s to the limiter, which slows down while the API pushes back.
+API_REQUESTS_PER_SECOND = 1.0
+
+# (category, type) combinations to extract - only shooting/by_zone for now
+COMBINATIONS = (("shooting", "by_zone"),)
 
 
 def main() -> NoReturn:
@@ -42,104 +47,107 @@ def main() -> NoReturn:
     season = Season.SEASON_2025
 
     # Initialize API clients
-    balldontlie = BalldontlieLib()
+    rate_limiter = TokenBucket(rate=API_REQUESTS_PER_SECOND)
+    balldontlie = BalldontlieLib(rate_limiter=rate_limiter)
     smartbetting = SmartbettingLib()
 
-    # Define all combinations - only general/advanced for now
-    combinations = [
-        ("shooting", "by_zone")
-    ]
-
     # Define season types for each category
     def get_season_types_for_category(category: str) -> list:
         # Only extract regular season data for now
         return ["regular"]
 
+    # Path and file name prefixes shared by every combination
+    table_path = f"{catalog}/{table}"
+    file_prefix = f"raw_{catalog}_{table}"
+
+    def process_combination(category: str, type_param: str, season_type: str) -> bool:
+        """Fetch and upload the season averages of one combination."""
+        combination = f"{category}/{type_param}/{season_type}/{season}"
+        try:
+            print(f"\nProcessing: {combination}")
+
+            # Fetch season averages data from API
+            response = balldontlie.get_season_averages(
+                category, season_type, type_param, season
+            )
+
+            if response is None or len(response) == 0:
+                print(f"No data received for {combination}")
+                return False
+
+            # Convert API response to dictionary format
+            data = smartbetting.convert_object_to_dict(response)
+
+            # Convert data to NDJSON format for BigQuery compatibility
+            ndjson_data = smartbetting.convert_to_ndjson(data)
+
+            # Generate blob name
+            gcs_blob_name = f"{table_path}/{combination}/{file_prefix}_{combination.replace('/', '_')}.json"
+
+            # Upload NDJSON data to Google Cloud Storage
+            smartbetting.upload_json_to_gcs(
+                ndjson_data,
+                bucket,
+                gcs_blob_name,
+                skip_if_unchanged=True,
+            )
+
+            print(
+                f"✅ Successfully uploaded {len(data)} records for {combination}"
+            )
+            return True
+
+        except Exception as e:
+            print(f"❌ Error processing {combination}: {str(e)}")
+            return False
+
     try:
+        print(f"Starting NBA season averages data pipeline for season {season}")
+        print(f"Total combinations to process: {len(COMBINATIONS)}")
+        print("=" * 80)
+
+        tasks = [
+            (category, type_param, season_type)
+            for category, type_param in COMBINATIONS
+            for season_type in get_season_types_for_category(category)
+        ]
+        total_combinations = len(tasks)
+
+        # Combinations are independent requests, so they run concurrently
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            results = list(executor.map(lambda task: process_combination(*task), tasks))
+
         total_successful = 0
         total_failed = 0
-        total_combinations = 0
 
-        print(f"Starting NBA season averages data pipeline for season {season}")
-        print(f"Total combinations to process: {len(combinations)}")
-        print("=" * 80)
+        for category, type_param in COMBINATIONS:
+            category_results = [
+                succeeded
+                for (task_category, task_type, _), succeeded in zip(tasks, results)
+                if task_category == category and task_type == type_param
+            ]
+            category_successful = sum(category_results)
+            category_failed = len(category_results) - category_successful
 
-        for category, type_param in combinations:
-            season_types = get_season_types_for_category(category)
-            category_total = len(season_types)
-            total_combinations += category_total
-
-            print(f"\n{'=' * 60}")
-            print(f"PROCESSING {category.upper()} CATEGORY")
-            print(f"{'=' * 60}")
-            print(f"Category: {category}")
-            print(f"Type: {type_param}")
-            print(f"Season Types: {season_types}")
-            print(f"Total combinations for this category: {category_total}")
-
-            category_successful = 0
-            category_failed = 0
-
-            for season_type in season_types:
-                try:
-                    print(
-                        f"\nProcessing: {category}/{type_param}/{season_type}/{season}"
-                    )
-
-                    # Fetch season averages data from API
-                    response = balldontlie.get_season_averages(
-                        category, season_type, type_param, season
-                    )
-
-                    if response is None or len(response) == 0:
-                        print(
-                            f"No data received for {category}/{type_param}/{season_type}/{season}"
-                        )
-                        category_failed += 1
-                        continue
-
-                    # Convert API response to dictionary format
-                    data = smartbetting.convert_object_to_dict(response)
-
-                    # Convert data to NDJSON format for BigQuery compatibility
-                    ndjson_data = smartbetting.convert_to_ndjson(data)
-
-                    # Generate storage path and blob name
-                    storage_path = f"{catalog}/{table}/{category}/{type_param}/{season_type}/{season}"
-                    gcs_blob_name = f"{storage_path}/raw_{catalog}_{table}_{category}_{type_param}_{season_type}_{season}.json"
-
-                    # Upload NDJSON data to Google Cloud Storage
-                    smartbetting.upload_json_to_gcs(ndjson_data, bucket, gcs_blob_name)
-
-                    print(
-                        f"✅ Successfully uploaded {len(data)} records for {category}/{type_param}/{season_type}/{season}"
-                    )
-                    category_successful += 1
-
-                except Exception as e:
-                    print(
-                        f"❌ Error processing {category}/{type_param}/{season_type}/{season}: {str(e)}"
-                    )
-                    category_failed += 1
-
-                # Add delay between API calls to respect rate limits
-                time.sleep(2)
-
-            # Print category summary
-            print(f"\n📊 {category.upper()} CATEGORY SUMMARY:")
-            print(f"✅ Successful: {category_successful}")
-            print(f"❌ Failed: {category_failed}")
-            print(f"📊 Total: {category_total}")
+            # Print category summary in a single write
+            print(
+                f"\n📊 {category.upper()} ({type_param}) CATEGORY SUMMARY:\n"
+                f"✅ Successful: {category_successful}\n"
+                f"❌ Failed: {category_failed}\n"
+                f"📊 Total: {len(category_results)}"
+            )
 
             total_successful += category_successful
             total_failed += category_failed
 
         # Print overall summary
-        print("\n" + "=" * 80)
-        print("OVERALL EXTRACTION SUMMARY:")
-        print(f"✅ Total successful extractions: {total_successful}")
-        print(f"❌ Total failed extractions: {total_failed}")
-        print(f"📊 Total combinations processed: {total_combinations}")
+        print(
+            "\n" + "=" * 80 + "\n"
+            "OVERALL EXTRACTION SUMMARY:\n"
+            f"✅ Total successful extractions: {total_successful}\n"
+            f"❌ Total failed extractions: {total_failed}\n"
+            f"📊 Total combinations processed: {total_combinations}"
+        )
 
         if total_successful > 0:
             print(
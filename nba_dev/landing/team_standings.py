@@ -5,13 +5,8 @@ This script fetches NBA team standings data from the Balldontlie API for
 the configured season and uploads to Google Cloud Storage.
 """
 
-import sys
-import os
 from typing import NoReturn
 
-# Add the project root to the Python path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-
 from lib_dev.balldontlie import BalldontlieLib
 from lib_dev.smartbetting import SmartbettingLib
 from lib_dev.utils import Bucket, Catalog, Season, Table
@@ -75,11 +70,16 @@ def main() -> NoReturn:
         # Convert data to NDJSON format for BigQuery compatibility
         ndjson_data = smartbetting.convert_to_ndjson(data)
 
-        # Upload NDJSON data to Google Cloud Storage
+        # Upload NDJSON data (skipped if the stored file is identical) to Google Cloud Storage
         gcs_blob_name = (
             f"{catalog}/{table}/{season}/raw_{catalog}_{table}_{season}.json"
         )
-        smartbetting.upload_json_to_gcs(ndjson_data, bucket, gcs_blob_name)
+        smartbetting.upload_json_to_gcs(
+            ndjson_data,
+            bucket,
+            gcs_blob_name,
+            skip_if_unchanged=True,
+        )
 
         print(
             f"Successfully processed and uploaded {len(data)} team standings to Google Cloud Storage"
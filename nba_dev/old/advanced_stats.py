@@ -5,18 +5,67 @@ This script fetches NBA advanced stats data from the Balldontlie API for both sp
 and entire seasons, then uploads it to Google Cloud Storage in the landing layer.
 """
 
-import sys
-import os
-import time
-from typing import NoReturn
-from datetime import date, timedelta
-
-# Add the project root to the Python path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, NoReturn, Optional
+from datetime import date
 
 from lib_dev.balldontlie import BalldontlieLib
 from lib_dev.smartbetting import SmartbettingLib
-from lib_dev.utils import Bucket, Catalog, Table, Season
+from lib_dev.utils import (
+    Bucket,
+    Catalog,
+    Table,
+    Season,
+    TokenBucket,
+    DateCache,
+    daterange,
+)
+
+# Number of dates fetched concurrently
+MAX_WORKERS = 4
+
+# Request rate shared by all workers. BalldontlieLib takes a token per page
+# and reports 429s to the limiter, which slows down while the API pushes back.
+API_REQUESTS_PER_SECOND = 1.0
+
+
+def fetch_advanced_stats(
+    current_date: date,
+    balldontlie: BalldontlieLib,
+    smartbetting: SmartbettingLib,
+    cache: DateCache,
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Fetch the advanced stats of a single date, using the local disk cache.
+
+    Advanced stats can land days after a game, so DateCache only keeps final
+    dates with at least one row on local disk for later runs. Recent or empty
+    dates are always requested from the API.
+
+    Args:
+        current_date: Date to fetch advanced stats for
+        balldontlie: Balldontlie API client
+        smartbetting: Smartbetting library used to convert the response
+        cache: Local disk cache of advanced stats by date
+
+    Returns:
+        List of advanced stats dictionaries, or None if the API returned no response
+    """
+    cached = cache.get(current_date)
+    if cached is not None:
+        return cached
+
+    response = balldontlie.get_advanced_stats(dates=[current_date])
+
+    if response is None:
+        return None
+
+    data = smartbetting.convert_object_to_dict(response) if len(response) > 0 else []
+
+    # DateCache skips recent and empty results, so they are fetched again
+    cache.put(current_date, data)
+
+    return data
 
 
 def main() -> NoReturn:
@@ -28,7 +77,8 @@ def main() -> NoReturn:
     2. Fetches advanced stats data for the entire 2024 season
     3. Converts the data to the required format
     4. Uploads the data to Google Cloud Storage in the landing layer
-    5. Includes longer delays between each date extraction to avoid rate limiting
+    5. Shares a token-bucket rate limit across workers to avoid rate limiting
+    6. Caches final dates on local disk so reruns do not hit the API again
 
     Returns:
         None
@@ -48,8 +98,10 @@ def main() -> NoReturn:
     end_date = date.today()  # Today's date
 
     # Initialize API clients
-    balldontlie = BalldontlieLib()
+    rate_limiter = TokenBucket(rate=API_REQUESTS_PER_SECOND)
+    balldontlie = BalldontlieLib(rate_limiter=rate_limiter)
     smartbetting = SmartbettingLib()
+    cache = DateCache(str(table))
 
     try:
         print("Starting NBA advanced stats data pipeline")
@@ -62,50 +114,54 @@ def main() -> NoReturn:
         print("EXTRACTING ADVANCED STATS BY DATE (DAILY)")
         print("=" * 60)
 
-        current_date = start_date
-        total_stats_by_date = 0
+        # Invariant part of the daily blob path
+        daily_blob_prefix = f"{catalog}/{table}/raw_{catalog}_{table}_"
 
-        while current_date <= end_date:
+        def process_date(current_date: date) -> int:
+            """Fetch, convert and upload the advanced stats of a single date."""
             print(f"\nProcessing advanced stats for date: {current_date}")
 
-            # Fetch advanced stats data from API for current date
-            response = balldontlie.get_advanced_stats(dates=[current_date])
+            # Fetch advanced stats data for current date (API or local cache)
+            data = fetch_advanced_stats(current_date, balldontlie, smartbetting, cache)
 
-            if response is None:
+            if data is None:
                 print(f"No advanced stats data received for {current_date}")
-                current_date += timedelta(days=1)
-                # Add small delay even when no data
-                time.sleep(2)
-                continue
+                return 0
 
-            if len(response) == 0:
-                print(f"No advanced stats found for {current_date}")
-                current_date += timedelta(days=1)
-                # Add small delay even when no data
-                time.sleep(2)
-                continue
+            daily_cache[current_date] = data
 
-            # Convert API response to dictionary format
-            data = smartbetting.convert_object_to_dict(response)
+            if len(data) == 0:
+                print(f"No advanced stats found for {current_date}")
+                return 0
 
             # Convert data to NDJSON format for BigQuery compatibility
             ndjson_data = smartbetting.convert_to_ndjson(data)
 
             # Upload NDJSON data to Google Cloud Storage (by date)
-            gcs_blob_name = f"{catalog}/{table}/raw_{catalog}_{table}_{current_date.strftime('%Y-%m-%d')}.json"
-            smartbetting.upload_json_to_gcs(ndjson_data, bucket, gcs_blob_name)
+            gcs_blob_name = f"{daily_blob_prefix}{current_date.isoformat()}.json"
+            smartbetting.upload_json_to_gcs(
+                ndjson_data, bucket, gcs_blob_name, skip_if_unchanged=True
+            )
+            daily_blob_names[current_date] = gcs_blob_name
 
             print(
                 f"✅ Successfully processed and uploaded {len(data)} advanced stats for {current_date}"
             )
-            total_stats_by_date += len(data)
 
-            # Add moderate delay between date extractions
-            print("Waiting 5 seconds before processing next date...")
-            time.sleep(5)
+            return len(data)
+
+        # Results per date, reused by the season extraction below
+        daily_cache: Dict[date, List[Dict[str, Any]]] = {}
+        # Daily blobs uploaded in this run, reused to compose the season file
+        daily_blob_names: Dict[date, str] = {}
+
+        dates = daterange(start_date, end_date)
+        total_stats_by_date = 0
 
-            # Move to next date
-            current_date += timedelta(days=1)
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = [executor.submit(process_date, d) for d in dates]
+            for future in as_completed(futures):
+                total_stats_by_date += future.result()
 
         print(
             f"\n📊 Daily extraction completed! Total advanced stats by date: {total_stats_by_date}"
@@ -125,51 +181,70 @@ def main() -> NoReturn:
 
         print(f"Season range: {season_start} to {season_end}")
 
-        # For season extraction, we'll collect all daily stats
-        all_season_stats = []
-        current_season_date = season_start
-
-        while current_season_date <= season_end:
-            if current_season_date <= date.today():  # Only process dates up to today
-                print(
-                    f"Processing season advanced stats for date: {current_season_date}"
-                )
-
-                response = balldontlie.get_advanced_stats(dates=[current_season_date])
-
-                if response and len(response) > 0:
-                    # Convert API response to dictionary format
-                    data = smartbetting.convert_object_to_dict(response)
-                    all_season_stats.extend(data)
-                    print(
-                        f"  Added {len(data)} advanced stats for {current_season_date}"
-                    )
-
-                # Add delay between API calls
-                time.sleep(2)
+        def fetch_season_date(current_season_date: date) -> None:
+            """Fetch the advanced stats of a season date not already in the cache."""
+            print(f"Processing season advanced stats for date: {current_season_date}")
 
-            current_season_date += timedelta(days=1)
+            data = fetch_advanced_stats(
+                current_season_date, balldontlie, smartbetting, cache
+            ) or []
+            if data:
+                print(f"  Added {len(data)} advanced stats for {current_season_date}")
+            daily_cache[current_season_date] = data
 
-        # Upload season data to Google Cloud Storage
-        if all_season_stats:
-            # Convert data to NDJSON format for BigQuery compatibility
-            ndjson_data = smartbetting.convert_to_ndjson(all_season_stats)
+        # Only process dates up to today
+        season_dates = daterange(season_start, min(season_end, date.today()))
 
-            # Upload NDJSON data to Google Cloud Storage (by season)
-            gcs_blob_name = (
-                f"{catalog}/{table}/{season}/raw_{catalog}_{table}_{season}.json"
-            )
-            smartbetting.upload_json_to_gcs(ndjson_data, bucket, gcs_blob_name)
+        # Dates already fetched by the daily extraction are not requested again
+        missing_dates = [d for d in season_dates if d not in daily_cache]
+        print(
+            f"Reusing {len(season_dates) - len(missing_dates)} dates from daily extraction"
+        )
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            list(executor.map(fetch_season_date, missing_dates))
+
+        season_stats_count = sum(len(daily_cache.get(d, [])) for d in season_dates)
+
+        # Upload season data to Google Cloud Storage (by season)
+        gcs_blob_name = f"{catalog}/{table}/{season}/raw_{catalog}_{table}_{season}.json"
+
+        if season_stats_count:
+            # The season file is the daily files stitched together server-side
+            # (in date order). Dates without a daily blob from this run are
+            # uploaded as temporary part files covering each gap.
+            source_blob_names: List[str] = []
+            part_blob_names: List[str] = []
+            pending_stats: List[Dict[str, Any]] = []
+
+            def flush_pending_stats() -> None:
+                if pending_stats:
+                    part_blob_name = f"{gcs_blob_name}.part{len(part_blob_names)}"
+                    ndjson_data = smartbetting.convert_to_ndjson(pending_stats)
+                    smartbetting.upload_json_to_gcs(ndjson_data, bucket, part_blob_name)
+                    part_blob_names.append(part_blob_name)
+                    source_blob_names.append(part_blob_name)
+                    pending_stats.clear()
+
+            for season_date in season_dates:
+                if season_date in daily_blob_names:
+                    flush_pending_stats()
+                    source_blob_names.append(daily_blob_names[season_date])
+                else:
+                    pending_stats.extend(daily_cache.get(season_date, []))
+            flush_pending_stats()
+
+            smartbetting.compose_gcs_blobs(bucket, source_blob_names, gcs_blob_name)
+
+            # Remove the temporary part files
+            if part_blob_names:
+                smartbetting.delete_gcs_folder_contents(bucket, f"{gcs_blob_name}.part")
 
             print(
-                f"✅ Successfully processed and uploaded {len(all_season_stats)} advanced stats for season {season}"
+                f"✅ Successfully processed and uploaded {season_stats_count} advanced stats for season {season}"
             )
         else:
             # Create empty file to indicate the pipeline ran
             ndjson_data = smartbetting.convert_to_ndjson([])
-            gcs_blob_name = (
-                f"{catalog}/{table}/{season}/raw_{catalog}_{table}_{season}.json"
-            )
             smartbetting.upload_json_to_gcs(ndjson_data, bucket, gcs_blob_name)
 
             print(
@@ -180,10 +255,8 @@ def main() -> NoReturn:
         print("\n" + "=" * 80)
         print("OVERALL ADVANCED STATS EXTRACTION SUMMARY:")
         print(f"📅 Stats by date: {total_stats_by_date}")
-        print(f"🏀 Stats by season: {len(all_season_stats)}")
-        print(
-            f"📊 Total stats processed: {total_stats_by_date + len(all_season_stats)}"
-        )
+        print(f"🏀 Stats by season: {season_stats_count}")
+        print(f"📊 Total stats processed: {total_stats_by_date + season_stats_count}")
         print(f"🎯 Season: {season}")
         print(f"📅 Date range: {start_date} to {end_date}")
 
@@ -5,16 +5,20 @@ This script fetches NBA leaders data from the Balldontlie API for various stat t
 and seasons, then uploads the data to Google Cloud Storage in the landing layer.
 """
 
-import sys
-import os
-from typing import NoReturn
-
-# Add the project root to the Python path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from concurrent.futures import ThreadPoolExecutor
+from typing import NoReturn, Optional, Tuple
 
 from lib_dev.balldontlie import BalldontlieLib
 from lib_dev.smartbetting import SmartbettingLib
-from lib_dev.utils import Bucket, Catalog, Table, Season
+from lib_dev.utils import Bucket, Catalog, Table, Season, TokenBucket
+
+# Number of stat type/season pairs fetched concurrently
+MAX_WORKERS = 4
+
+# Request rate shared by all workers. BalldontlieLib takes a token per request,
+# retries included, and reports 429s to the limiter, which slows down while
+# the API pushes back.
+API_REQUESTS_PER_SECOND = 1.0
 
 
 def main() -> NoReturn:
@@ -44,64 +48,58 @@ def main() -> NoReturn:
     seasons = [Season.SEASON_2024]  # Current season
 
     # Initialize API clients
-    balldontlie = BalldontlieLib()
+    rate_limiter = TokenBucket(rate=API_REQUESTS_PER_SECOND)
+    balldontlie = BalldontlieLib(rate_limiter=rate_limiter)
     smartbetting = SmartbettingLib()
 
-    try:
-        total_leaders_processed = 0
-        failed_requests = []
+    def process_leaders(stat_type: str, season: Season) -> Tuple[int, Optional[str]]:
+        """Fetch and upload the leaders of one stat type and season."""
+        try:
+            print(f"\nProcessing leaders for stat_type: {stat_type}, season: {season}")
+
+            # Fetch leaders data from API
+            response = balldontlie.get_leaders(stat_type=stat_type, season=season)
+
+            if response is None or len(response) == 0:
+                print(f"No leaders data received for {stat_type} in season {season}")
+                return 0, "No response from API"
+
+            # Convert API response to dictionary format
+            data = smartbetting.convert_object_to_dict(response)
 
+            # Convert data to NDJSON format for BigQuery compatibility
+            ndjson_data = smartbetting.convert_to_ndjson(data)
+
+            # Upload NDJSON data to Google Cloud Storage
+            gcs_blob_name = f"{catalog}/{table}/{season}/raw_{catalog}_{table}_{stat_type}_{season}.json"
+            smartbetting.upload_json_to_gcs(ndjson_data, bucket, gcs_blob_name)
+
+            print(
+                f"Successfully processed and uploaded {len(data)} leaders for {stat_type} in season {season}"
+            )
+            return len(data), None
+
+        except Exception as e:
+            print(f"Error processing {stat_type} for season {season}: {str(e)}")
+            return 0, str(e)
+
+    try:
         print(
             f"Starting NBA leaders data pipeline for {len(stat_types)} stat types and {len(seasons)} seasons"
         )
 
-        for season in seasons:
-            for stat_type in stat_types:
-                try:
-                    print(
-                        f"\nProcessing leaders for stat_type: {stat_type}, season: {season}"
-                    )
-
-                    # Fetch leaders data from API
-                    response = balldontlie.get_leaders(
-                        stat_type=stat_type, season=season
-                    )
-
-                    if response is None or len(response) == 0:
-                        print(
-                            f"No leaders data received for {stat_type} in season {season}"
-                        )
-                        failed_requests.append(
-                            (stat_type, season, "No response from API")
-                        )
-                        continue
-
-                    # Convert API response to dictionary format
-                    data = smartbetting.convert_object_to_dict(response)
-
-                    # Convert data to NDJSON format for BigQuery compatibility
-                    ndjson_data = smartbetting.convert_to_ndjson(data)
-
-                    # Upload NDJSON data to Google Cloud Storage
-                    gcs_blob_name = f"{catalog}/{table}/{season}/raw_{catalog}_{table}_{stat_type}_{season}.json"
-                    smartbetting.upload_json_to_gcs(ndjson_data, bucket, gcs_blob_name)
-
-                    print(
-                        f"Successfully processed and uploaded {len(data)} leaders for {stat_type} in season {season}"
-                    )
-                    total_leaders_processed += len(data)
-
-                    # Add small delay between requests to respect API rate limits
-                    import time
-
-                    time.sleep(2)
-
-                except Exception as e:
-                    error_msg = (
-                        f"Error processing {stat_type} for season {season}: {str(e)}"
-                    )
-                    print(error_msg)
-                    failed_requests.append((stat_type, season, str(e)))
+        tasks = [(stat_type, season) for season in seasons for stat_type in stat_types]
+
+        # Stat types are independent requests, so they run concurrently
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            results = list(executor.map(lambda task: process_leaders(*task), tasks))
+
+        total_leaders_processed = sum(count for count, _ in results)
+        failed_requests = [
+            (stat_type, season, error)
+            for (stat_type, season), (_, error) in zip(tasks, results)
+            if error is not None
+        ]
 
         print(
             f"\nPipeline completed! Total leaders processed: {total_leaders_processed}"
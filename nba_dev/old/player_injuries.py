@@ -5,13 +5,8 @@ This script fetches NBA player injuries data from the Balldontlie API and
 uploads it to Google Cloud Storage in the landing layer.
 """
 
-import sys
-import os
 from typing import NoReturn
 
-# Add the project root to the Python path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-
 from lib_dev.balldontlie import BalldontlieLib
 from lib_dev.smartbetting import SmartbettingLib
 from lib_dev.utils import Bucket, Catalog, Table, Season
@@ -52,16 +47,16 @@ def main() -> NoReturn:
         print("Fetching player injuries data...")
         response = balldontlie.get_injuries()
 
-        if response is None:
-            print("❌ No response received from API")
-            return
-
-        if len(response) == 0:
-            print("⚠️  No player injuries data received")
+        if not response:
+            if response is None:
+                print("❌ No response received from API")
+            else:
+                print("⚠️  No player injuries data received")
             return
 
         # Convert API response to dictionary format
         data = smartbetting.convert_object_to_dict(response)
+        total_records = len(data)
 
         # Convert data to NDJSON format for BigQuery compatibility
         ndjson_data = smartbetting.convert_to_ndjson(data)
@@ -71,30 +66,34 @@ def main() -> NoReturn:
         gcs_blob_name = f"{storage_path}/raw_{catalog}_{table}_{season}.json"
 
         # Upload NDJSON data to Google Cloud Storage
-        smartbetting.upload_json_to_gcs(ndjson_data, bucket, gcs_blob_name)
-
-        print(f"✅ Successfully uploaded {len(data)} player injuries records")
+        smartbetting.upload_json_to_gcs(
+            ndjson_data,
+            bucket,
+            gcs_blob_name,
+            skip_if_unchanged=True,
+        )
+
+        print(f"✅ Successfully uploaded {total_records} player injuries records")
         print(f"📁 Stored in: {gcs_blob_name}")
 
         # Show sample data structure
-        if data and len(data) > 0:
-            sample_record = data[0]
-            print(f"📊 Sample fields: {list(sample_record.keys())}")
-
-            # Show player info if available
-            if "player" in sample_record:
-                player = sample_record["player"]
-                print(
-                    f"👤 Sample player: {player.get('first_name', 'N/A')} {player.get('last_name', 'N/A')}"
-                )
-                print(f"🏥 Sample injury status: {sample_record.get('status', 'N/A')}")
-                print(
-                    f"📅 Sample return date: {sample_record.get('return_date', 'N/A')}"
-                )
+        sample_record = data[0]
+        print(f"📊 Sample fields: {list(sample_record.keys())}")
+
+        # Show player info if available
+        if "player" in sample_record:
+            player = sample_record["player"]
+            print(
+                f"👤 Sample player: {player.get('first_name', 'N/A')} {player.get('last_name', 'N/A')}"
+            )
+            print(f"🏥 Sample injury status: {sample_record.get('status', 'N/A')}")
+            print(
+                f"📅 Sample return date: {sample_record.get('return_date', 'N/A')}"
+            )
 
         print("\n" + "=" * 80)
         print("🎉 PLAYER INJURIES EXTRACTION COMPLETED SUCCESSFULLY!")
-        print(f"📊 Total records extracted: {len(data)}")
+        print(f"📊 Total records extracted: {total_records}")
         print("=" * 80)
 
     except Exception as e:
@@ -5,13 +5,8 @@ This script fetches NBA teams data from the Balldontlie API and uploads
 it to S3 in the bronze layer of the data lake.
 """
 
-import sys
-import os
 from typing import NoReturn
 
-# Add the project root to the Python path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-
 from lib_dev.balldontlie import BalldontlieLib
 from lib_dev.smartbetting import SmartbettingLib
 from lib_dev.utils import Bucket, Catalog, Table, Season
@@ -56,9 +51,11 @@ def main() -> NoReturn:
         # Convert data to NDJSON format for BigQuery compatibility
         ndjson_data = smartbetting.convert_to_ndjson(data)
 
-        # Upload NDJSON data to GCS
+        # Upload NDJSON data (skipped if the stored file is identical) to GCS
         gcs_key = f"{catalog}/{table}/{season}/raw_{catalog}_{table}_{season}.json"
-        smartbetting.upload_json_to_gcs(ndjson_data, bucket, gcs_key)
+        smartbetting.upload_json_to_gcs(
+            ndjson_data, bucket, gcs_key, skip_if_unchanged=True
+        )
 
         print(f"Successfully processed and uploaded {len(data)} teams to GCS")
 
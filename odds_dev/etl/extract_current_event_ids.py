@@ -19,15 +19,15 @@ Path Structure:
 - Output Path: odds/event_id/season_2025/
 """
 
-import sys
-import os
-
-# Add the project root to the Python path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
 
 from lib_dev.smartbetting import SmartbettingLib
 from lib_dev.utils import Bucket, Catalog, Table, Season
 
+# Number of events files read and saved concurrently
+MAX_WORKERS = 8
+
 
 def main():
     """
@@ -78,22 +78,16 @@ def main():
 
     print(f"Found {len(events_files)} events file(s)")
 
-    # Process each file separately
-    total_files_processed = 0
-    total_events_processed = 0
-
-    for file_name in events_files:
-        print(f"\n{'─' * 60}")
-        print(f"📄 Processing file: {file_name.split('/')[-1]}")
+    def process_file(file_name: str) -> Tuple[int, Optional[str]]:
+        """Extract and save the event IDs of one events file."""
+        short_name = file_name.split("/")[-1]
 
         # Extract date from filename
         file_date = smartbetting.extract_date_from_filename(file_name)
 
         if not file_date:
-            print("⚠️  Could not extract date from filename, skipping...")
-            continue
-
-        print(f"📅 Extracted date: {file_date}")
+            print(f"⚠️  {short_name}: could not extract date from filename, skipping...")
+            return 0, None
 
         # Extract event IDs from this file
         event_data = smartbetting.extract_event_ids_from_single_file(
@@ -102,10 +96,10 @@ def main():
         )
 
         if not event_data:
-            print("⚠️  No events found in this file")
-            continue
+            print(f"⚠️  {short_name}: no events found in this file")
+            return 0, None
 
-        print(f"Found {len(event_data)} event(s)")
+        print(f"📅 {short_name}: found {len(event_data)} event(s) for {file_date}")
 
         # Save event IDs to storage with the date from source file
         saved_path = smartbetting.save_event_ids_to_storage(
@@ -119,10 +113,19 @@ def main():
 
         if saved_path:
             print(f"✅ Saved to: {saved_path}")
-            total_files_processed += 1
-            total_events_processed += len(event_data)
         else:
-            print("❌ Failed to save event data")
+            print(f"❌ {short_name}: failed to save event data")
+
+        return len(event_data), saved_path
+
+    # Files are independent, so they are read and saved concurrently
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = list(executor.map(process_file, events_files))
+
+    total_files_processed = sum(1 for _, saved_path in results if saved_path)
+    total_events_processed = sum(
+        event_count for event_count, saved_path in results if saved_path
+    )
 
     # Final summary
     print("\n" + "=" * 60)
@@ -9,13 +9,8 @@ This processes all open/upcoming events regardless of their commence time.
 Each event's odds are saved in a separate file for granular data management.
 """
 
-import sys
-import os
 from datetime import date
 
-# Add the project root to the Python path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-
 from lib_dev.theoddsapi import TheOddsAPILib
 from lib_dev.smartbetting import SmartbettingLib
 from lib_dev.utils import Bucket, Catalog, Season, Table
@@ -8,14 +8,9 @@ This creates a snapshot of all open/upcoming events, regardless of when they occ
 The file is overwritten on each execution with the latest snapshot.
 """
 
-import sys
-import os
 from typing import NoReturn
 from datetime import datetime
 
-# Add the project root to the Python path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-
 from lib_dev.theoddsapi import TheOddsAPILib
 from lib_dev.smartbetting import SmartbettingLib
 from lib_dev.utils import Bucket, Catalog, Table, Season
@@ -6,15 +6,10 @@ and fetches historical odds for each event from The Odds API, then saves them
 to Google Cloud Storage in the odds/landing/historical_event_odds folder.
 """
 
-import sys
-import os
 from typing import Dict, Any, Optional
 from datetime import date, datetime, timedelta
 import time
 
-# Add the project root to the Python path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-
 from lib_dev.theoddsapi import TheOddsAPILib
 from lib_dev.smartbetting import SmartbettingLib
 from lib_dev.utils import Bucket, Catalog, Season, Table
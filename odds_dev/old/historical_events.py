@@ -13,17 +13,12 @@ and commence_time_to parameters to filter by the event's start time.
 ⚠️  WARNING: This endpoint costs 1 credit per request and requires a paid plan!
 """
 
-import sys
-import os
 from typing import NoReturn
 from datetime import date, timedelta
 
-# Add the project root to the Python path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-
 from lib_dev.theoddsapi import TheOddsAPILib
 from lib_dev.smartbetting import SmartbettingLib
-from lib_dev.utils import Bucket, Catalog, Season
+from lib_dev.utils import Bucket, Catalog, Season, daterange
 
 
 def main() -> NoReturn:
@@ -61,7 +56,6 @@ def main() -> NoReturn:
     smartbetting = SmartbettingLib()
 
     try:
-        current_date = start_date
         total_events_processed = 0
         total_requests_made = 0
 
@@ -70,7 +64,7 @@ def main() -> NoReturn:
         )
         print("⚠️  WARNING: This will cost 1 credit per day!")
 
-        while current_date <= end_date:
+        for current_date in daterange(start_date, end_date):
             print(f"\nProcessing historical events for date: {current_date}")
 
             # Convert date to ISO8601 format for the API
@@ -94,7 +88,6 @@ def main() -> NoReturn:
 
             if response is None:
                 print(f"No historical events data received for {current_date}")
-                current_date += timedelta(days=1)
                 continue
 
             # Extract data from response
@@ -102,7 +95,6 @@ def main() -> NoReturn:
 
             if len(events_data) == 0:
                 print(f"No historical events found for {current_date}")
-                current_date += timedelta(days=1)
                 continue
 
             # The Odds API returns native Python dictionaries, not Pydantic objects
@@ -128,9 +120,6 @@ def main() -> NoReturn:
             total_events_processed += len(data)
             total_requests_made += 1
 
-            # Move to next date
-            current_date += timedelta(days=1)
-
         print("\nPipeline completed!")
         print(f"Total historical events processed: {total_events_processed}")
         print(f"Total API requests made: {total_requests_made}")
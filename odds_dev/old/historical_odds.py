@@ -7,14 +7,9 @@ it to S3 in the bronze layer of the data lake.
 ⚠️  WARNING: This endpoint costs 10 credits per market per region and requires a paid plan!
 """
 
-import sys
-import os
 from typing import NoReturn
 from datetime import datetime, timedelta
 
-# Add the project root to the Python path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-
 from lib_dev.theoddsapi import TheOddsAPILib
 from lib_dev.smartbetting import SmartbettingLib
 from lib_dev.utils import Bucket, Catalog, Schema, Table
@@ -6,18 +6,13 @@ and date range extractions, then uploads it to Google Cloud Storage in the landi
 Includes proper rate limiting, error handling, and cost optimization.
 """
 
-import sys
-import os
 import time
 from typing import NoReturn
 from datetime import date, timedelta
 
-# Add the project root to the Python path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-
 from lib_dev.theoddsapi import TheOddsAPILib
 from lib_dev.smartbetting import SmartbettingLib
-from lib_dev.utils import Bucket, Catalog, Table, Season
+from lib_dev.utils import Bucket, Catalog, Table, Season, daterange
 
 
 def main() -> NoReturn:
@@ -64,9 +59,8 @@ def main() -> NoReturn:
 
         total_events_processed = 0
         total_requests_made = 0
-        current_date = start_date
 
-        while current_date <= end_date:
+        for current_date in daterange(start_date, end_date):
             print(f"\nProcessing odds for date: {current_date}")
 
             # Fetch NBA odds data from API
@@ -83,7 +77,6 @@ def main() -> NoReturn:
 
             if response is None or len(response) == 0:
                 print(f"No odds data received for {current_date}")
-                current_date += timedelta(days=1)
                 continue
 
             # The Odds API returns native Python dictionaries
@@ -104,11 +97,8 @@ def main() -> NoReturn:
             total_events_processed += len(data)
             total_requests_made += 1
 
-            # Move to next date
-            current_date += timedelta(days=1)
-
             # Add delay between requests to respect rate limits
-            if current_date <= end_date:
+            if current_date + timedelta(days=1) <= end_date:
                 print("Waiting 2 seconds before next request...")
                 time.sleep(2)
 